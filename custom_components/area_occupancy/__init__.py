@@ -19,9 +19,23 @@ from homeassistant.helpers import (
     config_validation as cv,
     device_registry as dr,
 )
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 
-from .const import CONF_AREA_ID, CONF_AREAS, CONF_VERSION, DB_NAME, DOMAIN, PLATFORMS
+from .const import (
+    CONF_AREA_ID,
+    CONF_AREAS,
+    CONF_PEOPLE,
+    CONF_PERSON_ENTITY,
+    CONF_PERSON_SLEEP_AREA,
+    CONF_PERSON_SLEEP_SENSOR,
+    CONF_PERSON_SLEEP_SENSORS,
+    CONF_VERSION,
+    DB_NAME,
+    DOMAIN,
+    PLATFORMS,
+    SIGNAL_PEOPLE_UPDATED,
+)
 from .coordinator import AreaOccupancyCoordinator
 from .db.operations import delete_area_data as _delete_area_data
 from .db.schema import (
@@ -469,13 +483,31 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+def _people_topology(people: list[dict[str, Any]]) -> list[tuple[Any, ...]]:
+    """Return the parts of the people config that decide entity topology.
+
+    Person entity, sleep sensors and sleep area determine which sleep presence
+    sensors exist; threshold and device tracker can be updated in place.
+    """
+    return [
+        (
+            person.get(CONF_PERSON_ENTITY),
+            person.get(CONF_PERSON_SLEEP_SENSORS, person.get(CONF_PERSON_SLEEP_SENSOR)),
+            person.get(CONF_PERSON_SLEEP_AREA),
+        )
+        for person in people
+        if isinstance(person, dict)
+    ]
+
+
 async def _async_entry_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle config entry update.
 
-    Detects whether the area structure changed (add/remove) or just settings
-    changed (threshold, weights).  Structural changes require a full reload
-    to create/destroy entity platform entries; setting changes are handled
-    with a lightweight in-place update.
+    Detects whether the area structure or people topology changed or just
+    settings changed (threshold, weights, person thresholds/trackers).
+    Structural changes require a full reload to create/destroy entity
+    platform entries; setting changes are handled with a lightweight
+    in-place update.
     """
     coordinator = hass.data.get(DOMAIN) or entry.runtime_data
     if coordinator is None:
@@ -496,12 +528,21 @@ async def _async_entry_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
         if area.config.area_id
     }
 
-    if config_area_ids != current_area_ids:
-        # Area structure changed — full reload needed for entity platform setup
+    new_people = entry.options.get(CONF_PEOPLE, [])
+    people_changed = new_people != coordinator.loaded_people
+    people_topology_changed = people_changed and _people_topology(
+        new_people
+    ) != _people_topology(coordinator.loaded_people)
+
+    if config_area_ids != current_area_ids or people_topology_changed:
+        # Area structure or people changed — full reload needed for entity
+        # platform setup (sleep presence sensors are built from people)
         _LOGGER.info(
-            "Area structure changed (configured=%s, loaded=%s), reloading integration",
+            "Area structure or people changed (configured=%s, loaded=%s, "
+            "people_changed=%s), reloading integration",
             config_area_ids,
             current_area_ids,
+            people_topology_changed,
         )
 
         # Remove devices for deleted areas before reload
@@ -524,4 +565,8 @@ async def _async_entry_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
                 await area.entities.cleanup()
             except Exception:
                 _LOGGER.exception("Failed to update config for area %s", area_name)
+        if people_changed:
+            # Threshold/device tracker edits: let sleep sensors re-read people
+            coordinator.loaded_people = list(new_people)
+            async_dispatcher_send(hass, SIGNAL_PEOPLE_UPDATED.format(entry.entry_id))
         await coordinator.async_request_refresh()
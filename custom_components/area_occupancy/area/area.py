@@ -21,6 +21,7 @@ from ..const import (
 )
 from ..data.activity import ActivityId, DetectedActivity, detect_activity
 from ..data.analysis import start_prior_analysis
+from ..data.decay import Decay
 from ..data.health import HealthMonitor
 from ..utils import (
     apply_activity_boost,
@@ -275,7 +276,10 @@ class Area:
         correlations = self._get_entity_correlations()
 
         return calc_presence(
-            entities, prior=self.prior.value, correlations=correlations
+            self.entities.presence_entities,
+            prior=self.prior.value,
+            correlations=correlations,
+            filtered=True,
         )
 
     def environmental_confidence(self) -> float:
@@ -293,7 +297,11 @@ class Area:
 
         correlations = self._get_entity_correlations()
 
-        return calc_env(entities, correlations=correlations)
+        return calc_env(
+            self.entities.environmental_entities,
+            correlations=correlations,
+            filtered=True,
+        )
 
     def _get_entity_correlations(self) -> dict[str, float]:
         """Get cached correlation strengths for this area.
@@ -335,8 +343,9 @@ class Area:
         This method should be called periodically (e.g., by the decay timer)
         to transition decay states when factors drop below threshold.
         """
-        for entity in self.entities.entities.values():
-            entity.decay.tick()
+        Decay.tick_many(
+            entity.decay for entity in self.entities.entities.values()
+        )
 
     def occupied(self) -> bool:
         """Return the current occupancy state (True/False) for this area.
@@ -16,6 +16,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_HOME, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     async_track_point_in_time,
     async_track_state_change_event,
@@ -45,6 +46,7 @@ from .const import (
     ATTR_VERIFICATION_PENDING,
     NAME_SLEEP_PRESENCE,
     NAME_WASP_IN_BOX,
+    SIGNAL_PEOPLE_UPDATED,
 )
 from .utils import generate_entity_unique_id
 
@@ -814,8 +816,28 @@ class SleepPresenceSensor(RestoreEntity, BinarySensorEntity):
 
         # Set up state tracking for all person + sleep confidence entities
         self._setup_entity_tracking()
+
+        # Threshold/device tracker edits are applied without a reload
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_PEOPLE_UPDATED.format(self._coordinator.entry_id),
+                self._handle_people_updated,
+            )
+        )
         _LOGGER.debug("SleepPresenceSensor setup completed for %s", self.entity_id)
 
+    @callback
+    def _handle_people_updated(self) -> None:
+        """Re-read people for this area after an in-place options update."""
+        area = self._get_area()
+        if area is None or not area.config.area_id:
+            return
+        self._people = self._coordinator.integration_config.get_people_for_area(
+            area.config.area_id
+        )
+        self._setup_entity_tracking()
+
     def _setup_entity_tracking(self) -> None:
         """Set up state tracking for person and sleep confidence entities."""
         if self._remove_state_listener is not None:
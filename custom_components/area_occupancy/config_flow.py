@@ -7,6 +7,7 @@ validation of all inputs to ensure a valid configuration.
 
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 import contextlib
 import logging
 from typing import Any, cast
@@ -155,6 +156,29 @@ THRESHOLD_STEP = 1
 THRESHOLD_MIN = 1
 THRESHOLD_MAX = 100
 
+# Select option value prefixes, with lengths for slicing off the prefix
+_AREA_OPTION_PREFIX_LEN = len(CONF_OPTION_PREFIX_AREA)
+_PERSON_OPTION_PREFIX = "person_"
+_PERSON_OPTION_PREFIX_LEN = len(_PERSON_OPTION_PREFIX)
+
+# Static menus and options shared by every render
+_INIT_MENU = (
+    CONF_ACTION_ADD_AREA,
+    "manage_areas",
+    CONF_ACTION_GLOBAL_SETTINGS,
+    CONF_ACTION_MANAGE_PEOPLE,
+)
+_AREA_ACTION_MENU = ("edit_area", "remove_area_confirm", "cancel_area_action")
+_REMOVE_AREA_MENU = ("confirm_remove_area", "cancel_remove_area")
+_PERSON_ACTION_MENU = ("edit_person", "remove_person_confirm", "cancel_person_action")
+_REMOVE_PERSON_MENU = ("confirm_remove_person", "cancel_remove_person")
+_ADD_PERSON_OPTION: SelectOptionDict = {"value": "add_person", "label": "Add Person"}
+
+# Wizard steps whose schema is built without reading hass, so an identical
+# error re-render can reuse the previous form. The motion and sensor steps
+# list entities from the registry, which can change between submits.
+_CACHEABLE_ERROR_FORM_STEPS = frozenset({"area_basics", "area_behavior"})
+
 
 def _seconds_to_duration(seconds: float) -> dict[str, int]:
     """Convert seconds to duration dict for DurationSelector.
@@ -1471,6 +1495,11 @@ def _get_purpose_display_name(purpose: str) -> str:
     return Purpose.display_name(purpose)
 
 
+def _sanitize_area_id(area_id: str) -> str:
+    """Sanitize an area ID for use in a select option value."""
+    return area_id.replace(" ", "_").replace("/", "_")
+
+
 def _find_area_by_sanitized_id(
     areas: list[dict[str, Any]], sanitized_id: str
 ) -> dict[str, Any] | None:
@@ -1487,8 +1516,7 @@ def _find_area_by_sanitized_id(
         area_id = area.get(CONF_AREA_ID)
         if not area_id:
             continue
-        area_sanitized = area_id.replace(" ", "_").replace("/", "_")
-        if area_sanitized == sanitized_id:
+        if _sanitize_area_id(area_id) == sanitized_id:
             return area
     return None
 
@@ -1627,6 +1655,30 @@ def _find_area_by_id(
     return None
 
 
+def _index_areas(
+    areas: list[dict[str, Any]],
+) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+    """Index areas by area ID and by sanitized area ID.
+
+    The first area wins on collisions, matching the linear lookups.
+
+    Args:
+        areas: List of area configuration dictionaries
+
+    Returns:
+        Tuple of (areas by ID, areas by sanitized ID)
+    """
+    by_id: dict[str, dict[str, Any]] = {}
+    by_sanitized_id: dict[str, dict[str, Any]] = {}
+    for area in areas:
+        area_id = area.get(CONF_AREA_ID)
+        if not area_id:
+            continue
+        by_id.setdefault(area_id, area)
+        by_sanitized_id.setdefault(_sanitize_area_id(area_id), area)
+    return by_id, by_sanitized_id
+
+
 def _update_area_in_list(
     areas: list[dict[str, Any]],
     updated_area: dict[str, Any],
@@ -1721,6 +1773,30 @@ def _validate_person_input(user_input: dict[str, Any]) -> dict[str, Any]:
     return result
 
 
+def _is_legacy_person(person: dict[str, Any]) -> bool:
+    """Return True if a person config only has the old single-sensor key."""
+    return (
+        CONF_PERSON_SLEEP_SENSORS not in person and CONF_PERSON_SLEEP_SENSOR in person
+    )
+
+
+def _migrate_legacy_person(person: dict[str, Any]) -> dict[str, Any]:
+    """Return a person config with the old single-sensor key as a sensor list.
+
+    Args:
+        person: Stored person configuration
+
+    Returns:
+        The same dict if already current, otherwise a migrated copy
+    """
+    if not _is_legacy_person(person):
+        return person
+    migrated = dict(person)
+    old_val = migrated.pop(CONF_PERSON_SLEEP_SENSOR)
+    migrated[CONF_PERSON_SLEEP_SENSORS] = [old_val] if old_val else []
+    return migrated
+
+
 def _handle_step_error(err: Exception) -> str:
     """Handle step errors and convert to user-friendly error message.
 
@@ -1791,7 +1867,7 @@ def _create_area_selector_schema(
 
         summary = _get_area_summary_info(area)
         # Use area_id for option value (sanitized)
-        sanitized_id = area_id.replace(" ", "_").replace("/", "_")
+        sanitized_id = _sanitize_area_id(area_id)
         # Include summary in label for better UX
         options.append(
             {
@@ -1800,6 +1876,18 @@ def _create_area_selector_schema(
             }
         )
 
+    return _create_select_option_schema(options)
+
+
+def _create_select_option_schema(options: list[SelectOptionDict]) -> vol.Schema:
+    """Create a single-field schema selecting one of the given options.
+
+    Args:
+        options: Options to offer in the list
+
+    Returns:
+        Schema with SelectSelector in LIST mode (radio buttons)
+    """
     return vol.Schema(
         {
             vol.Required("selected_option"): SelectSelector(
@@ -1812,6 +1900,34 @@ def _create_area_selector_schema(
     )
 
 
+# The person form has no per-render inputs; suggested values are applied on top
+_PERSON_CONFIG_BASE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_PERSON_ENTITY): EntitySelector(
+            EntitySelectorConfig(domain="person")
+        ),
+        vol.Required(CONF_PERSON_SLEEP_SENSORS): EntitySelector(
+            EntitySelectorConfig(domain=["sensor", "binary_sensor"], multiple=True)
+        ),
+        vol.Required(CONF_PERSON_SLEEP_AREA): AreaSelector(AreaSelectorConfig()),
+        vol.Optional(
+            CONF_PERSON_CONFIDENCE_THRESHOLD,
+            default=DEFAULT_SLEEP_CONFIDENCE_THRESHOLD,
+        ): NumberSelector(
+            NumberSelectorConfig(
+                min=1,
+                max=100,
+                step=5,
+                mode=NumberSelectorMode.SLIDER,
+            )
+        ),
+        vol.Optional(CONF_PERSON_DEVICE_TRACKER): EntitySelector(
+            EntitySelectorConfig(domain="device_tracker")
+        ),
+    }
+)
+
+
 def _create_global_settings_schema(defaults: dict[str, Any]) -> vol.Schema:
     """Create schema for global settings."""
     return vol.Schema(
@@ -1992,20 +2108,18 @@ class BaseOccupancyFlow:
 
         return errors
 
-    def _prepare_area_action_edit(self) -> None:
-        """Prepare state for editing an area."""
-        self._area_to_remove = None
-
-    def _prepare_area_action_remove(self) -> None:
-        """Prepare state for removing an area."""
-        area_id = self._area_being_edited
-        self._area_to_remove = area_id
-        self._area_being_edited = None
+    def _show_static_menu(
+        self, step_id: str, menu_options: tuple[str, ...]
+    ) -> ConfigFlowResult:
+        """Show a menu without placeholders, reusing its result within this flow.
 
-    def _prepare_area_action_cancel(self) -> None:
-        """Prepare state for cancelling area action."""
-        self._area_to_remove = None
-        self._area_being_edited = None
+        Such menus are identical on every render, and the flow manager does
+        not mutate returned results.
+        """
+        if (result := self._menu_results.get(step_id)) is None:
+            result = self.async_show_menu(step_id=step_id, menu_options=menu_options)
+            self._menu_results[step_id] = result
+        return result
 
     # ── Multi-step area config wizard ────────────────────────────────
 
@@ -2037,6 +2151,48 @@ class BaseOccupancyFlow:
                 area_name = _resolve_area_id_to_name(self.hass, area_id)
         return {"area_name": area_name}
 
+    def _get_cached_error_form(
+        self,
+        step_id: str,
+        user_input: dict[str, Any] | None,
+        errors: dict[str, str],
+        placeholders: dict[str, str],
+    ) -> ConfigFlowResult | None:
+        """Return the previous form result if this error re-render is identical.
+
+        Resubmitting the same invalid input produces the same form, so the
+        schema does not need to be rebuilt. Only steps whose schema does not
+        depend on registry state are cached.
+        """
+        if not errors or step_id not in _CACHEABLE_ERROR_FORM_STEPS:
+            return None
+        key = (step_id, user_input, errors, placeholders)
+        if key == self._last_form_key:
+            return self._last_form_result
+        return None
+
+    def _show_wizard_form(
+        self,
+        step_id: str,
+        data_schema: vol.Schema,
+        errors: dict[str, str],
+        placeholders: dict[str, str],
+        user_input: dict[str, Any] | None,
+        last_step: bool,
+    ) -> ConfigFlowResult:
+        """Show a wizard form, remembering it when it is an error re-render."""
+        result = self.async_show_form(
+            step_id=step_id,
+            data_schema=data_schema,
+            errors=errors,
+            description_placeholders=placeholders,
+            last_step=last_step,
+        )
+        if errors and step_id in _CACHEABLE_ERROR_FORM_STEPS:
+            self._last_form_key = (step_id, user_input, errors, placeholders)
+            self._last_form_result = result
+        return result
+
     async def async_step_area_basics(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -2071,6 +2227,22 @@ class BaseOccupancyFlow:
                 self._area_config_draft.update(user_input)
                 return await self.async_step_area_motion()
 
+        # Build description placeholders
+        if self._area_being_edited and self._area_config_draft.get(CONF_AREA_ID):
+            area_name = self._area_config_draft.get(CONF_AREA_ID, "")
+            with contextlib.suppress(ValueError):
+                area_name = _resolve_area_id_to_name(
+                    self.hass, self._area_config_draft[CONF_AREA_ID]
+                )
+            placeholders = {"mode": "Editing", "area_name": area_name}
+        else:
+            placeholders = {"mode": "Adding", "area_name": "New Area"}
+
+        if cached := self._get_cached_error_form(
+            "area_basics", user_input, errors, placeholders
+        ):
+            return cached
+
         schema_dict = _create_basics_step_schema(
             is_editing=self._area_being_edited is not None
         )
@@ -2089,23 +2261,8 @@ class BaseOccupancyFlow:
         else:
             data_schema = base_schema
 
-        # Build description placeholders
-        if self._area_being_edited and self._area_config_draft.get(CONF_AREA_ID):
-            area_name = self._area_config_draft.get(CONF_AREA_ID, "")
-            with contextlib.suppress(ValueError):
-                area_name = _resolve_area_id_to_name(
-                    self.hass, self._area_config_draft[CONF_AREA_ID]
-                )
-            placeholders = {"mode": "Editing", "area_name": area_name}
-        else:
-            placeholders = {"mode": "Adding", "area_name": "New Area"}
-
-        return self.async_show_form(
-            step_id="area_basics",
-            data_schema=data_schema,
-            errors=errors,
-            description_placeholders=placeholders,
-            last_step=False,
+        return self._show_wizard_form(
+            "area_basics", data_schema, errors, placeholders, user_input, False
         )
 
     async def async_step_area_motion(
@@ -2133,6 +2290,8 @@ class BaseOccupancyFlow:
                 self._area_config_draft.update(flattened)
                 return await self.async_step_area_sensors()
 
+        placeholders = self._get_wizard_placeholders()
+
         schema_dict = _create_motion_step_schema(
             self.hass, show_advanced=self.show_advanced_options
         )
@@ -2157,12 +2316,8 @@ class BaseOccupancyFlow:
             else:
                 data_schema = base_schema
 
-        return self.async_show_form(
-            step_id="area_motion",
-            data_schema=data_schema,
-            errors=errors,
-            description_placeholders=self._get_wizard_placeholders(),
-            last_step=False,
+        return self._show_wizard_form(
+            "area_motion", data_schema, errors, placeholders, user_input, False
         )
 
     async def async_step_area_sensors(
@@ -2200,6 +2355,8 @@ class BaseOccupancyFlow:
                 self._area_config_draft.update(flattened)
                 return await self.async_step_area_behavior()
 
+        placeholders = self._get_wizard_placeholders()
+
         schema_dict = _create_sensors_step_schema(self.hass)
         base_schema = vol.Schema(schema_dict)
 
@@ -2225,12 +2382,8 @@ class BaseOccupancyFlow:
         else:
             data_schema = base_schema
 
-        return self.async_show_form(
-            step_id="area_sensors",
-            data_schema=data_schema,
-            errors=errors,
-            description_placeholders=self._get_wizard_placeholders(),
-            last_step=False,
+        return self._show_wizard_form(
+            "area_sensors", data_schema, errors, placeholders, user_input, False
         )
 
     async def async_step_area_behavior(
@@ -2253,11 +2406,19 @@ class BaseOccupancyFlow:
             validation_errors = self._validate_config(candidate, self.hass)
 
             if not validation_errors:
-                self._area_config_draft.update(candidate)
-                return await self._on_area_config_complete(self._area_config_draft)
+                # candidate already holds draft + input; adopt it rather than
+                # merging it back into the draft key by key
+                self._area_config_draft = candidate
+                return await self._on_area_config_complete(candidate)
 
             errors.update(validation_errors)
 
+        placeholders = self._get_wizard_placeholders()
+        if cached := self._get_cached_error_form(
+            "area_behavior", user_input, errors, placeholders
+        ):
+            return cached
+
         schema_dict = _create_behavior_step_schema(
             self._area_config_draft,
             show_advanced=self.show_advanced_options,
@@ -2289,12 +2450,8 @@ class BaseOccupancyFlow:
         else:
             data_schema = base_schema
 
-        return self.async_show_form(
-            step_id="area_behavior",
-            data_schema=data_schema,
-            errors=errors,
-            description_placeholders=self._get_wizard_placeholders(),
-            last_step=True,
+        return self._show_wizard_form(
+            "area_behavior", data_schema, errors, placeholders, user_input, True
         )
 
 
@@ -2320,6 +2477,9 @@ class AreaOccupancyConfigFlow(ConfigFlow, BaseOccupancyFlow, domain=DOMAIN):
         self._area_being_edited: str | None = None  # Store area ID (not name)
         self._area_to_remove: str | None = None  # Store area ID (not name)
         self._area_config_draft: dict[str, Any] = {}
+        self._last_form_key: tuple[Any, ...] | None = None
+        self._last_form_result: ConfigFlowResult | None = None
+        self._menu_results: dict[str, ConfigFlowResult] = {}
 
     def _get_wizard_areas(self) -> list[dict[str, Any]]:
         """Get areas list for duplicate checking."""
@@ -2384,7 +2544,7 @@ class AreaOccupancyConfigFlow(ConfigFlow, BaseOccupancyFlow, domain=DOMAIN):
             selected_option = user_input.get("selected_option", "")
             if selected_option.startswith(CONF_OPTION_PREFIX_AREA):
                 # User selected an area - extract area ID and go to action step
-                sanitized_id = selected_option.replace(CONF_OPTION_PREFIX_AREA, "", 1)
+                sanitized_id = selected_option[_AREA_OPTION_PREFIX_LEN:]
                 # Find the actual area by matching sanitized IDs
                 area = _find_area_by_sanitized_id(self._areas, sanitized_id)
                 if area:
@@ -2489,7 +2649,7 @@ class AreaOccupancyConfigFlow(ConfigFlow, BaseOccupancyFlow, domain=DOMAIN):
 
         return self.async_show_menu(
             step_id="area_action",
-            menu_options=["edit_area", "remove_area_confirm", "cancel_area_action"],
+            menu_options=_AREA_ACTION_MENU,
             description_placeholders=description_placeholders,
         )
 
@@ -2497,21 +2657,23 @@ class AreaOccupancyConfigFlow(ConfigFlow, BaseOccupancyFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Edit the selected area."""
-        self._prepare_area_action_edit()
+        self._area_to_remove = None
         return await self.async_step_area_config()
 
     async def async_step_remove_area_confirm(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Initiate area removal."""
-        self._prepare_area_action_remove()
+        self._area_to_remove = self._area_being_edited
+        self._area_being_edited = None
         return await self.async_step_remove_area()
 
     async def async_step_cancel_area_action(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Cancel area action and return to main menu."""
-        self._prepare_area_action_cancel()
+        self._area_to_remove = None
+        self._area_being_edited = None
         return await self.async_step_user()
 
     async def async_step_remove_area(
@@ -2522,10 +2684,7 @@ class AreaOccupancyConfigFlow(ConfigFlow, BaseOccupancyFlow, domain=DOMAIN):
         if not area_id:
             return await self.async_step_user()
 
-        return self.async_show_menu(
-            step_id="remove_area",
-            menu_options=["confirm_remove_area", "cancel_remove_area"],
-        )
+        return self._show_static_menu("remove_area", _REMOVE_AREA_MENU)
 
     async def async_step_confirm_remove_area(
         self, user_input: dict[str, Any] | None = None
@@ -2568,20 +2727,62 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
         self._area_being_edited: str | None = None
         self._area_to_remove: str | None = None
         self._area_config_draft: dict[str, Any] = {}
+        self._last_form_key: tuple[Any, ...] | None = None
+        self._last_form_result: ConfigFlowResult | None = None
+        self._menu_results: dict[str, ConfigFlowResult] = {}
         self._person_being_edited: int | None = None  # Index into people list
         self._person_to_remove: int | None = None  # Index into people list for removal
+        self._areas_cache: list[dict[str, Any]] | None = None
+        self._areas_by_id: dict[str, dict[str, Any]] | None = None
+        self._areas_by_sanitized_id: dict[str, dict[str, Any]] | None = None
+        self._people_cache: Sequence[dict[str, Any]] | None = None
+        self._person_name_cache: dict[str, str] = {}
+        self._area_name_cache: dict[str, str] = {}
+        self._people_options_cache: (
+            tuple[tuple[tuple[Any, ...], ...], list[SelectOptionDict]] | None
+        ) = None
 
     def _get_areas_from_config(self) -> list[dict[str, Any]]:
-        """Get areas list from merged config entry data+options."""
-        merged = dict(self.config_entry.data)
-        merged.update(self.config_entry.options)
-        areas = merged.get(CONF_AREAS, [])
+        """Get areas list, loading it from the config entry once per flow."""
+        if self._areas_cache is None:
+            self._areas_cache = self._load_areas_from_config()
+        return self._areas_cache
+
+    def _get_area_indexes(
+        self,
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, dict[str, Any]]]:
+        """Get cached (by ID, by sanitized ID) area lookups."""
+        if self._areas_by_id is None or self._areas_by_sanitized_id is None:
+            self._areas_by_id, self._areas_by_sanitized_id = _index_areas(
+                self._get_areas_from_config()
+            )
+        return self._areas_by_id, self._areas_by_sanitized_id
+
+    def _invalidate_areas_cache(self) -> None:
+        """Drop cached areas after the stored areas list is rewritten."""
+        self._areas_cache = None
+        self._areas_by_id = None
+        self._areas_by_sanitized_id = None
+
+    def _load_areas_from_config(self) -> list[dict[str, Any]]:
+        """Get areas list from merged config entry data+options.
+
+        Returns the stored list itself when every item is valid; callers
+        treat it as read-only and build new lists when mutating.
+        """
+        options = self.config_entry.options
+        if CONF_AREAS in options:
+            areas = options[CONF_AREAS]
+        else:
+            areas = self.config_entry.data.get(CONF_AREAS, [])
         if not isinstance(areas, list):
             _LOGGER.warning(
                 "CONF_AREAS has unexpected type %s, using empty list",
                 type(areas).__name__,
             )
             return []
+        if all(isinstance(item, dict) for item in areas):
+            return areas
         valid_areas: list[dict[str, Any]] = []
         for i, item in enumerate(areas):
             if isinstance(item, dict):
@@ -2598,6 +2799,10 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
         """Get areas list for duplicate checking."""
         return self._get_areas_from_config()
 
+    def _options_with(self, changes: dict[str, Any]) -> dict[str, Any]:
+        """Return a copy of the current options with the given keys replaced."""
+        return {**self.config_entry.options, **changes}
+
     async def _on_area_config_complete(
         self, config: dict[str, Any]
     ) -> ConfigFlowResult:
@@ -2607,30 +2812,26 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
         The _async_entry_updated listener detects the structural change and
         triggers a full reload to create/destroy entity platform entries.
         """
-        areas = self._get_areas_from_config()
-        areas = _update_area_in_list(areas, config, self._area_being_edited)
+        current_areas = self._get_areas_from_config()
+        areas = _update_area_in_list(current_areas, config, self._area_being_edited)
 
         self._area_being_edited = None
         self._area_config_draft = {}
+        if areas == current_areas:
+            # Nothing changed; skip the write so the listener doesn't run
+            return self.async_abort(reason="no_change")
+        self._invalidate_areas_cache()
 
         # Store updated areas in options; the update listener handles the reload
-        config_data = dict(self.config_entry.options)
-        config_data[CONF_AREAS] = areas
-        return self.async_create_entry(title="", data=config_data)
+        return self.async_create_entry(
+            title="", data=self._options_with({CONF_AREAS: areas})
+        )
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Show options menu."""
-        return self.async_show_menu(
-            step_id="init",
-            menu_options=[
-                CONF_ACTION_ADD_AREA,
-                "manage_areas",
-                CONF_ACTION_GLOBAL_SETTINGS,
-                CONF_ACTION_MANAGE_PEOPLE,
-            ],
-        )
+        return self._show_static_menu("init", _INIT_MENU)
 
     async def async_step_add_area(
         self, user_input: dict[str, Any] | None = None
@@ -2651,8 +2852,8 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
         if user_input is not None:
             selected_option = user_input.get("selected_option", "")
             if selected_option.startswith(CONF_OPTION_PREFIX_AREA):
-                sanitized_id = selected_option.replace(CONF_OPTION_PREFIX_AREA, "", 1)
-                area = _find_area_by_sanitized_id(areas, sanitized_id)
+                sanitized_id = selected_option[_AREA_OPTION_PREFIX_LEN:]
+                area = self._get_area_indexes()[1].get(sanitized_id)
                 if area:
                     self._area_being_edited = area.get(CONF_AREA_ID)
                     return await self.async_step_area_action()
@@ -2672,8 +2873,7 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
         if not area_id:
             return await self.async_step_init()
 
-        areas = self._get_areas_from_config()
-        area_config = _find_area_by_id(areas, area_id)
+        area_config = self._get_area_indexes()[0].get(area_id)
         if not area_config:
             return await self.async_step_init()
 
@@ -2683,7 +2883,7 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
 
         return self.async_show_menu(
             step_id="area_action",
-            menu_options=["edit_area", "remove_area_confirm", "cancel_area_action"],
+            menu_options=_AREA_ACTION_MENU,
             description_placeholders=description_placeholders,
         )
 
@@ -2691,7 +2891,7 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Edit the selected area."""
-        self._prepare_area_action_edit()
+        self._area_to_remove = None
         self._init_area_wizard()
         return await self.async_step_area_basics()
 
@@ -2699,14 +2899,16 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Initiate area removal."""
-        self._prepare_area_action_remove()
+        self._area_to_remove = self._area_being_edited
+        self._area_being_edited = None
         return await self.async_step_remove_area()
 
     async def async_step_cancel_area_action(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Cancel area action and return to main menu."""
-        self._prepare_area_action_cancel()
+        self._area_to_remove = None
+        self._area_being_edited = None
         return await self.async_step_init()
 
     async def async_step_remove_area(
@@ -2717,10 +2919,7 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
         if not area_id:
             return await self.async_step_init()
 
-        return self.async_show_menu(
-            step_id="remove_area",
-            menu_options=["confirm_remove_area", "cancel_remove_area"],
-        )
+        return self._show_static_menu("remove_area", _REMOVE_AREA_MENU)
 
     async def async_step_confirm_remove_area(
         self, user_input: dict[str, Any] | None = None
@@ -2736,9 +2935,10 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
             return self.async_abort(reason="cannot_remove_last_area")
 
         self._area_to_remove = None
-        config_data = dict(self.config_entry.options)
-        config_data[CONF_AREAS] = updated_areas
-        return self.async_create_entry(title="", data=config_data)
+        self._invalidate_areas_cache()
+        return self.async_create_entry(
+            title="", data=self._options_with({CONF_AREAS: updated_areas})
+        )
 
     async def async_step_cancel_remove_area(
         self, user_input: dict[str, Any] | None = None
@@ -2753,9 +2953,9 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
         """Manage global settings."""
         if user_input is not None:
             # Update the config entry options directly
-            new_options = dict(self.config_entry.options)
-            new_options.update(user_input)
-
+            new_options = self._options_with(user_input)
+            if new_options == self.config_entry.options:
+                return self.async_abort(reason="no_change")
             return self.async_create_entry(title="", data=new_options)
 
         # Get current values
@@ -2773,32 +2973,55 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
             data_schema=_create_global_settings_schema(defaults),
         )
 
+    def _get_people(self) -> Sequence[dict[str, Any]]:
+        """Get configured people as a read-only view, loaded once per flow.
+
+        The stored options list is returned as-is unless an entry still uses
+        the old single-sensor key, in which case a migrated copy is built so
+        later steps never see the legacy form. Copy before mutating.
+        """
+        if self._people_cache is None:
+            stored: Sequence[dict[str, Any]] = self.config_entry.options.get(
+                CONF_PEOPLE, ()
+            )
+            if any(_is_legacy_person(person) for person in stored):
+                stored = [_migrate_legacy_person(person) for person in stored]
+            self._people_cache = stored
+        return self._people_cache
+
     def _get_person_display_name(self, person_entity: str) -> str:
         """Get friendly display name for a person entity."""
+        if (name := self._person_name_cache.get(person_entity)) is not None:
+            return name
         person_state = self.hass.states.get(person_entity)
-        return (
+        name = (
             person_state.attributes.get("friendly_name", person_entity)
             if person_state
             else person_entity
         )
+        self._person_name_cache[person_entity] = name
+        return name
 
     async def async_step_manage_people(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Manage configured people for sleep tracking."""
         errors: dict[str, str] = {}
-        people: list[dict[str, Any]] = list(
-            self.config_entry.options.get(CONF_PEOPLE, [])
-        )
+        people = self._get_people()
 
-        if user_input is not None:
+        if user_input is None:
+            # Fresh render of the people list: pick up any renamed persons/areas
+            self._person_name_cache.clear()
+            self._area_name_cache.clear()
+            self._people_options_cache = None
+        else:
             selected = user_input.get("selected_option", "")
             if selected == "add_person":
                 self._person_being_edited = None
                 return await self.async_step_person_config()
-            if selected.startswith("person_"):
+            if selected.startswith(_PERSON_OPTION_PREFIX):
                 try:
-                    idx = int(selected.replace("person_", ""))
+                    idx = int(selected[_PERSON_OPTION_PREFIX_LEN:])
                 except (ValueError, TypeError):
                     idx = -1
                 if 0 <= idx < len(people):
@@ -2806,54 +3029,69 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
                     return await self.async_step_person_action()
                 errors["base"] = "invalid_selection"
 
-        # Build options list - one entry per person
-        options: list[SelectOptionDict] = []
-        for i, person in enumerate(people):
-            person_entity = person.get(CONF_PERSON_ENTITY, "unknown")
-            sleep_area = person.get(CONF_PERSON_SLEEP_AREA, "unknown")
-
-            area_name = sleep_area
-            with contextlib.suppress(ValueError):
-                area_name = _resolve_area_id_to_name(self.hass, sleep_area)
+        return self.async_show_form(
+            step_id="manage_people",
+            data_schema=_create_select_option_schema(
+                self._get_people_options(people)
+            ),
+            errors=errors,
+        )
 
-            person_name = self._get_person_display_name(person_entity)
-            threshold = person.get(
-                CONF_PERSON_CONFIDENCE_THRESHOLD, DEFAULT_SLEEP_CONFIDENCE_THRESHOLD
-            )
-            options.append(
-                {
-                    "value": f"person_{i}",
-                    "label": f"{person_name} → {area_name} (threshold: {threshold}%)",
-                }
+    def _get_people_options(
+        self, people: Sequence[dict[str, Any]]
+    ) -> list[SelectOptionDict]:
+        """Build the people select options, reusing them if people are unchanged."""
+        key = tuple(
+            (
+                person.get(CONF_PERSON_ENTITY),
+                person.get(CONF_PERSON_SLEEP_AREA),
+                person.get(CONF_PERSON_CONFIDENCE_THRESHOLD),
             )
+            for person in people
+        )
+        if self._people_options_cache is not None:
+            cached_key, cached_options = self._people_options_cache
+            if cached_key == key:
+                return cached_options
+
+        # Build options list - one entry per person, then "Add Person"
+        options = [
+            self._build_person_option(i, person) for i, person in enumerate(people)
+        ]
+        options.append(_ADD_PERSON_OPTION)
 
-        options.append({"value": "add_person", "label": "Add Person"})
+        self._people_options_cache = (key, options)
+        return options
 
-        schema = vol.Schema(
-            {
-                vol.Required("selected_option"): SelectSelector(
-                    SelectSelectorConfig(
-                        options=options,
-                        mode=SelectSelectorMode.LIST,
-                    )
-                )
-            }
-        )
+    def _build_person_option(
+        self, index: int, person: dict[str, Any]
+    ) -> SelectOptionDict:
+        """Build the select option for one configured person."""
+        person_entity = person.get(CONF_PERSON_ENTITY, "unknown")
+        sleep_area = person.get(CONF_PERSON_SLEEP_AREA, "unknown")
 
-        return self.async_show_form(
-            step_id="manage_people",
-            data_schema=schema,
-            errors=errors,
+        area_name = self._area_name_cache.get(sleep_area)
+        if area_name is None:
+            area_name = sleep_area
+            with contextlib.suppress(ValueError):
+                area_name = _resolve_area_id_to_name(self.hass, sleep_area)
+                self._area_name_cache[sleep_area] = area_name
+
+        person_name = self._get_person_display_name(person_entity)
+        threshold = person.get(
+            CONF_PERSON_CONFIDENCE_THRESHOLD, DEFAULT_SLEEP_CONFIDENCE_THRESHOLD
         )
+        return {
+            "value": f"{_PERSON_OPTION_PREFIX}{index}",
+            "label": f"{person_name} → {area_name} (threshold: {threshold}%)",
+        }
 
     async def async_step_person_action(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Show action menu for a selected person."""
         idx = self._person_being_edited
-        people: list[dict[str, Any]] = list(
-            self.config_entry.options.get(CONF_PEOPLE, [])
-        )
+        people = self._get_people()
         if idx is None or not (0 <= idx < len(people)):
             return await self.async_step_init()
 
@@ -2864,11 +3102,7 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
 
         return self.async_show_menu(
             step_id="person_action",
-            menu_options=[
-                "edit_person",
-                "remove_person_confirm",
-                "cancel_person_action",
-            ],
+            menu_options=_PERSON_ACTION_MENU,
             description_placeholders={"person_name": person_name},
         )
 
@@ -2898,9 +3132,7 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
     ) -> ConfigFlowResult:
         """Confirm removal of a person via menu."""
         idx = self._person_to_remove
-        people: list[dict[str, Any]] = list(
-            self.config_entry.options.get(CONF_PEOPLE, [])
-        )
+        people = self._get_people()
         if idx is None or not (0 <= idx < len(people)):
             return await self.async_step_init()
 
@@ -2911,7 +3143,7 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
 
         return self.async_show_menu(
             step_id="remove_person",
-            menu_options=["confirm_remove_person", "cancel_remove_person"],
+            menu_options=_REMOVE_PERSON_MENU,
             description_placeholders={"person_name": person_name},
         )
 
@@ -2920,20 +3152,19 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
     ) -> ConfigFlowResult:
         """Execute person removal."""
         idx = self._person_to_remove
-        people: list[dict[str, Any]] = list(
-            self.config_entry.options.get(CONF_PEOPLE, [])
-        )
+        people = self._get_people()
         if idx is None or not (0 <= idx < len(people)):
             return await self.async_step_init()
 
-        updated_people = [p for i, p in enumerate(people) if i != idx]
-        config_data = dict(self.config_entry.options)
-        config_data[CONF_PEOPLE] = updated_people
-        result = self.async_create_entry(title="", data=config_data)
-        self.hass.async_create_task(
-            self.hass.config_entries.async_reload(self.config_entry.entry_id)
+        # people is the shared cache; pop from a copy
+        updated_people = list(people)
+        del updated_people[idx]
+        # The update listener detects the people change and reloads
+        result = self.async_create_entry(
+            title="", data=self._options_with({CONF_PEOPLE: updated_people})
         )
         self._person_to_remove = None
+        self._people_cache = None
         return result
 
     async def async_step_cancel_remove_person(
@@ -2948,22 +3179,8 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
     ) -> ConfigFlowResult:
         """Configure a person for sleep tracking."""
         errors: dict[str, str] = {}
-        people: list[dict[str, Any]] = list(
-            self.config_entry.options.get(CONF_PEOPLE, [])
-        )
-
-        # Get defaults for editing
-        defaults: dict[str, Any] = {}
+        people = self._get_people()
         idx = getattr(self, "_person_being_edited", None)
-        if idx is not None and 0 <= idx < len(people):
-            defaults = dict(people[idx])
-            # Migrate old single-sensor key to list for form population
-            if (
-                CONF_PERSON_SLEEP_SENSORS not in defaults
-                and CONF_PERSON_SLEEP_SENSOR in defaults
-            ):
-                old_val = defaults.pop(CONF_PERSON_SLEEP_SENSOR)
-                defaults[CONF_PERSON_SLEEP_SENSORS] = [old_val] if old_val else []
 
         if user_input is not None:
             # Check for duplicate person entity before validation
@@ -2980,64 +3197,40 @@ class AreaOccupancyOptionsFlow(OptionsFlow, BaseOccupancyFlow):
                 try:
                     person_data = _validate_person_input(user_input)
 
-                    # Update or add person
+                    # Update or add person; the update listener reloads the
+                    # integration when the people topology changes, while
+                    # threshold/tracker edits are applied in place
                     updated_people = list(people)
                     if idx is not None and 0 <= idx < len(updated_people):
                         updated_people[idx] = person_data
                     else:
                         updated_people.append(person_data)
 
-                    config_data = dict(self.config_entry.options)
-                    config_data[CONF_PEOPLE] = updated_people
-                    result = self.async_create_entry(title="", data=config_data)
-                    # Trigger integration reload to update sleep presence sensors
-                    self.hass.async_create_task(
-                        self.hass.config_entries.async_reload(
-                            self.config_entry.entry_id
-                        )
+                    result = self.async_create_entry(
+                        title="",
+                        data=self._options_with({CONF_PEOPLE: updated_people}),
                     )
+                    self._people_cache = None
 
                 except (vol.Invalid, ValueError, TypeError) as err:
                     errors["base"] = _handle_step_error(err)
                 else:
                     return result
 
-        base_schema = vol.Schema(
-            {
-                vol.Required(CONF_PERSON_ENTITY): EntitySelector(
-                    EntitySelectorConfig(domain="person")
-                ),
-                vol.Required(CONF_PERSON_SLEEP_SENSORS): EntitySelector(
-                    EntitySelectorConfig(
-                        domain=["sensor", "binary_sensor"], multiple=True
-                    )
-                ),
-                vol.Required(CONF_PERSON_SLEEP_AREA): AreaSelector(
-                    AreaSelectorConfig()
-                ),
-                vol.Optional(
-                    CONF_PERSON_CONFIDENCE_THRESHOLD,
-                    default=DEFAULT_SLEEP_CONFIDENCE_THRESHOLD,
-                ): NumberSelector(
-                    NumberSelectorConfig(
-                        min=1,
-                        max=100,
-                        step=5,
-                        mode=NumberSelectorMode.SLIDER,
-                    )
-                ),
-                vol.Optional(CONF_PERSON_DEVICE_TRACKER): EntitySelector(
-                    EntitySelectorConfig(domain="device_tracker")
-                ),
-            }
-        )
-
-        # Use suggested values for edit mode
-        suggested = user_input if user_input is not None else defaults
+        # Use suggested values for edit mode. Error re-renders show the
+        # submitted input, so stored defaults are only read on first render
+        # (add_suggested_values_to_schema only reads them; no copy needed).
+        suggested: Mapping[str, Any] = {}
+        if user_input is not None:
+            suggested = user_input
+        elif idx is not None and 0 <= idx < len(people):
+            suggested = people[idx]
         if suggested:
-            data_schema = self.add_suggested_values_to_schema(base_schema, suggested)
+            data_schema = self.add_suggested_values_to_schema(
+                _PERSON_CONFIG_BASE_SCHEMA, suggested
+            )
         else:
-            data_schema = base_schema
+            data_schema = _PERSON_CONFIG_BASE_SCHEMA
 
         return self.async_show_form(
             step_id="person_config",
@@ -100,6 +100,9 @@ CONF_PERSON_SLEEP_AREA: Final = "sleep_area_id"
 CONF_PERSON_CONFIDENCE_THRESHOLD: Final = "confidence_threshold"
 CONF_PERSON_DEVICE_TRACKER: Final = "device_tracker"
 
+# Dispatcher signal (formatted with entry_id) for people edits applied in place
+SIGNAL_PEOPLE_UPDATED: Final = "area_occupancy_people_updated_{}"
+
 
 # Configured Weights
 CONF_WEIGHT_SLEEP: Final = "weight_sleep"
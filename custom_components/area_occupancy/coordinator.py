@@ -28,7 +28,14 @@ from homeassistant.util import dt as dt_util
 
 # Local imports
 from .area import AllAreas, Area, AreaDeviceHandle, FloorAreas
-from .const import CONF_AREA_ID, CONF_AREAS, DEFAULT_NAME, DOMAIN, SAVE_INTERVAL
+from .const import (
+    CONF_AREA_ID,
+    CONF_AREAS,
+    CONF_PEOPLE,
+    DEFAULT_NAME,
+    DOMAIN,
+    SAVE_INTERVAL,
+)
 from .data.analysis import run_full_analysis
 from .data.config import IntegrationConfig
 from .db import AreaOccupancyDB
@@ -57,6 +64,12 @@ class AreaOccupancyCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         # Integration-level configuration (global settings for entire integration)
         self.integration_config = IntegrationConfig(self, config_entry)
 
+        # People options the sleep presence sensors are built from; a change
+        # requires a reload to recreate those entities
+        self.loaded_people: list[dict[str, Any]] = list(
+            config_entry.options.get(CONF_PEOPLE, [])
+        )
+
         # Multi-area architecture: dict[str, Area] keyed by area name
         self.areas: dict[str, Area] = {}
         self._area_handles: dict[str, AreaDeviceHandle] = {}
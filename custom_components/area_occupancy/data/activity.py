@@ -6,10 +6,12 @@ and the area's configured purpose.
 
 from __future__ import annotations
 
-from contextlib import suppress
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import lru_cache
 import logging
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from ..const import (
@@ -43,18 +45,25 @@ class ActivityId(StrEnum):
     WORKING = "working"
 
 
-@dataclass(frozen=True)
+class EnvironmentalCondition(StrEnum):
+    """Direction an environmental reading moves when an activity occurs."""
+
+    ELEVATED = "elevated"
+    SUPPRESSED = "suppressed"
+
+
+@dataclass(frozen=True, slots=True)
 class Indicator:
     """A single sensor signal that indicates an activity."""
 
     input_type: InputType
     weight: float
     require_active: bool = True
-    environmental_condition: str | None = None
+    environmental_condition: EnvironmentalCondition | None = None
     ha_device_classes: frozenset[str] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ActivityDefinition:
     """An activity with its indicators and constraints."""
 
@@ -65,9 +74,12 @@ class ActivityDefinition:
     occupancy_boost: float = 0.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DetectedActivity:
-    """Result of activity detection."""
+    """Result of activity detection.
+
+    Frozen so evidence-free results can be shared between calls.
+    """
 
     activity_id: ActivityId
     confidence: float
@@ -77,6 +89,23 @@ class DetectedActivity:
 
 # --- Activity Definitions ---
 
+# Shared purpose and device-class sets, so definitions reuse one instance
+# (and its cached hash) instead of each building an equal frozenset.
+_BATHROOM_PURPOSES = frozenset({AreaPurpose.BATHROOM})
+_FOOD_PREP_PURPOSES = frozenset({AreaPurpose.FOOD_PREP})
+_TV_PURPOSES = frozenset(
+    {AreaPurpose.SOCIAL, AreaPurpose.RELAXING, AreaPurpose.SLEEPING}
+)
+_MUSIC_PURPOSES = frozenset(
+    {AreaPurpose.SOCIAL, AreaPurpose.RELAXING, AreaPurpose.WORKING}
+)
+_WORKING_PURPOSES = frozenset({AreaPurpose.WORKING})
+_SLEEPING_PURPOSES = frozenset({AreaPurpose.SLEEPING})
+_EATING_PURPOSES = frozenset({AreaPurpose.EATING})
+
+_TV_DEVICE_CLASSES = frozenset({"tv", "receiver"})
+_SPEAKER_DEVICE_CLASSES = frozenset({"speaker", "receiver"})
+
 ACTIVITY_DEFINITIONS: tuple[ActivityDefinition, ...] = (
     ActivityDefinition(
         activity_id=ActivityId.SHOWERING,
@@ -85,18 +114,18 @@ ACTIVITY_DEFINITIONS: tuple[ActivityDefinition, ...] = (
                 InputType.HUMIDITY,
                 0.5,
                 require_active=False,
-                environmental_condition="elevated",
+                environmental_condition=EnvironmentalCondition.ELEVATED,
             ),
             Indicator(
                 InputType.TEMPERATURE,
                 0.2,
                 require_active=False,
-                environmental_condition="elevated",
+                environmental_condition=EnvironmentalCondition.ELEVATED,
             ),
             Indicator(InputType.MOTION, 0.15),
             Indicator(InputType.DOOR, 0.15),
         ),
-        purposes=frozenset({AreaPurpose.BATHROOM}),
+        purposes=_BATHROOM_PURPOSES,
         occupancy_boost=ACTIVITY_BOOST_HIGH,
     ),
     ActivityDefinition(
@@ -106,19 +135,19 @@ ACTIVITY_DEFINITIONS: tuple[ActivityDefinition, ...] = (
                 InputType.HUMIDITY,
                 0.4,
                 require_active=False,
-                environmental_condition="elevated",
+                environmental_condition=EnvironmentalCondition.ELEVATED,
             ),
             Indicator(InputType.DOOR, 0.3),
             Indicator(
                 InputType.TEMPERATURE,
                 0.2,
                 require_active=False,
-                environmental_condition="elevated",
+                environmental_condition=EnvironmentalCondition.ELEVATED,
             ),
             Indicator(InputType.MOTION, 0.1),
         ),
         min_match_weight=0.3,
-        purposes=frozenset({AreaPurpose.BATHROOM}),
+        purposes=_BATHROOM_PURPOSES,
         occupancy_boost=ACTIVITY_BOOST_HIGH,
     ),
     ActivityDefinition(
@@ -129,29 +158,29 @@ ACTIVITY_DEFINITIONS: tuple[ActivityDefinition, ...] = (
                 InputType.TEMPERATURE,
                 0.2,
                 require_active=False,
-                environmental_condition="elevated",
+                environmental_condition=EnvironmentalCondition.ELEVATED,
             ),
             Indicator(
                 InputType.HUMIDITY,
                 0.15,
                 require_active=False,
-                environmental_condition="elevated",
+                environmental_condition=EnvironmentalCondition.ELEVATED,
             ),
             Indicator(
                 InputType.CO2,
                 0.1,
                 require_active=False,
-                environmental_condition="elevated",
+                environmental_condition=EnvironmentalCondition.ELEVATED,
             ),
             Indicator(
                 InputType.VOC,
                 0.1,
                 require_active=False,
-                environmental_condition="elevated",
+                environmental_condition=EnvironmentalCondition.ELEVATED,
             ),
             Indicator(InputType.MOTION, 0.1),
         ),
-        purposes=frozenset({AreaPurpose.FOOD_PREP}),
+        purposes=_FOOD_PREP_PURPOSES,
         occupancy_boost=ACTIVITY_BOOST_MODERATE,
     ),
     ActivityDefinition(
@@ -160,25 +189,23 @@ ACTIVITY_DEFINITIONS: tuple[ActivityDefinition, ...] = (
             Indicator(
                 InputType.MEDIA,
                 0.6,
-                ha_device_classes=frozenset({"tv", "receiver"}),
+                ha_device_classes=_TV_DEVICE_CLASSES,
             ),
             Indicator(
                 InputType.ILLUMINANCE,
                 0.15,
                 require_active=False,
-                environmental_condition="suppressed",
+                environmental_condition=EnvironmentalCondition.SUPPRESSED,
             ),
             Indicator(InputType.MOTION, 0.1),
             Indicator(
                 InputType.SOUND_PRESSURE,
                 0.15,
                 require_active=False,
-                environmental_condition="elevated",
+                environmental_condition=EnvironmentalCondition.ELEVATED,
             ),
         ),
-        purposes=frozenset(
-            {AreaPurpose.SOCIAL, AreaPurpose.RELAXING, AreaPurpose.SLEEPING}
-        ),
+        purposes=_TV_PURPOSES,
         occupancy_boost=ACTIVITY_BOOST_STRONG,
     ),
     ActivityDefinition(
@@ -187,19 +214,17 @@ ACTIVITY_DEFINITIONS: tuple[ActivityDefinition, ...] = (
             Indicator(
                 InputType.MEDIA,
                 0.5,
-                ha_device_classes=frozenset({"speaker", "receiver"}),
+                ha_device_classes=_SPEAKER_DEVICE_CLASSES,
             ),
             Indicator(
                 InputType.SOUND_PRESSURE,
                 0.3,
                 require_active=False,
-                environmental_condition="elevated",
+                environmental_condition=EnvironmentalCondition.ELEVATED,
             ),
             Indicator(InputType.MOTION, 0.2),
         ),
-        purposes=frozenset(
-            {AreaPurpose.SOCIAL, AreaPurpose.RELAXING, AreaPurpose.WORKING}
-        ),
+        purposes=_MUSIC_PURPOSES,
         occupancy_boost=ACTIVITY_BOOST_MILD,
     ),
     ActivityDefinition(
@@ -212,16 +237,16 @@ ACTIVITY_DEFINITIONS: tuple[ActivityDefinition, ...] = (
                 InputType.CO2,
                 0.1,
                 require_active=False,
-                environmental_condition="elevated",
+                environmental_condition=EnvironmentalCondition.ELEVATED,
             ),
             Indicator(
                 InputType.ILLUMINANCE,
                 0.1,
                 require_active=False,
-                environmental_condition="elevated",
+                environmental_condition=EnvironmentalCondition.ELEVATED,
             ),
         ),
-        purposes=frozenset({AreaPurpose.WORKING}),
+        purposes=_WORKING_PURPOSES,
         occupancy_boost=ACTIVITY_BOOST_MODERATE,
     ),
     ActivityDefinition(
@@ -232,22 +257,22 @@ ACTIVITY_DEFINITIONS: tuple[ActivityDefinition, ...] = (
                 InputType.ILLUMINANCE,
                 0.2,
                 require_active=False,
-                environmental_condition="suppressed",
+                environmental_condition=EnvironmentalCondition.SUPPRESSED,
             ),
             Indicator(
                 InputType.CO2,
                 0.15,
                 require_active=False,
-                environmental_condition="elevated",
+                environmental_condition=EnvironmentalCondition.ELEVATED,
             ),
             Indicator(
                 InputType.SOUND_PRESSURE,
                 0.15,
                 require_active=False,
-                environmental_condition="suppressed",
+                environmental_condition=EnvironmentalCondition.SUPPRESSED,
             ),
         ),
-        purposes=frozenset({AreaPurpose.SLEEPING}),
+        purposes=_SLEEPING_PURPOSES,
         occupancy_boost=ACTIVITY_BOOST_HIGH,
     ),
     ActivityDefinition(
@@ -258,84 +283,198 @@ ACTIVITY_DEFINITIONS: tuple[ActivityDefinition, ...] = (
                 InputType.ILLUMINANCE,
                 0.25,
                 require_active=False,
-                environmental_condition="elevated",
+                environmental_condition=EnvironmentalCondition.ELEVATED,
             ),
             Indicator(
                 InputType.CO2,
                 0.2,
                 require_active=False,
-                environmental_condition="elevated",
+                environmental_condition=EnvironmentalCondition.ELEVATED,
             ),
             Indicator(
                 InputType.TEMPERATURE,
                 0.15,
                 require_active=False,
-                environmental_condition="elevated",
+                environmental_condition=EnvironmentalCondition.ELEVATED,
             ),
             Indicator(InputType.MEDIA, 0.1),
         ),
-        purposes=frozenset({AreaPurpose.EATING}),
+        purposes=_EATING_PURPOSES,
         occupancy_boost=ACTIVITY_BOOST_MILD,
     ),
 )
 
 
-def _environmental_signal_strength(
-    value: float,
-    mean_occupied: float,
-    mean_unoccupied: float,
-    condition: str,
-) -> float:
-    """Compute 0-1 signal strength for an environmental reading.
+# Indicators sharing input type, activity requirement, condition and
+# device-class filter produce the same match strength, so signals are
+# memoized on this key per detection.
+_SignalKey = tuple[
+    InputType, bool, EnvironmentalCondition | None, frozenset[str] | None
+]
+
 
-    Uses learned Gaussian means to determine how far the current value
-    has moved from unoccupied toward occupied (or away, for suppressed).
+@dataclass(frozen=True, slots=True)
+class CompiledDefinition:
+    """An activity definition flattened for scoring.
 
-    Returns 0.0 when means are too close to distinguish.
+    Signal keys and weights are stored as parallel tuples so the detection
+    loop avoids per-indicator attribute lookups and key construction.
+    suffix_weights[i] is the weight still available from indicator i on,
+    used to stop scoring a definition that can no longer win.
     """
-    span = mean_occupied - mean_unoccupied
-    if abs(span) < 1e-9:
-        return 0.0
-
-    if condition == "elevated":
-        position = (value - mean_unoccupied) / span
-    elif condition == "suppressed":
-        position = (mean_unoccupied - value) / abs(span)
-    else:
-        return 0.0
 
-    return max(0.0, min(1.0, position))
+    definition: ActivityDefinition
+    total_weight: float
+    signal_keys: tuple[_SignalKey, ...]
+    weights: tuple[float, ...]
+    suffix_weights: tuple[float, ...]
+    is_specific: bool
+
+
+def _compile_definition(defn: ActivityDefinition) -> CompiledDefinition:
+    """Flatten a definition into its scoring tables."""
+    weights = tuple(ind.weight for ind in defn.indicators)
+    return CompiledDefinition(
+        definition=defn,
+        total_weight=sum(weights),
+        signal_keys=tuple(
+            (
+                ind.input_type,
+                ind.require_active,
+                ind.environmental_condition,
+                ind.ha_device_classes,
+            )
+            for ind in defn.indicators
+        ),
+        weights=weights,
+        suffix_weights=tuple(sum(weights[i:]) for i in range(len(weights))),
+        is_specific=bool(defn.purposes),
+    )
 
 
-def _score_indicator(indicator: Indicator, area: Area) -> tuple[float, list[str]]:
+def _build_defs_by_purpose() -> dict[
+    AreaPurpose | None, tuple[CompiledDefinition, ...]
+]:
+    """Index compiled definitions by the purposes they apply to.
+
+    The ``None`` key holds purpose-agnostic definitions for areas whose
+    purpose is not a known AreaPurpose. Definitions with no weight can never
+    match and are dropped.
+    """
+    compiled = [
+        c
+        for c in map(_compile_definition, ACTIVITY_DEFINITIONS)
+        if c.total_weight > 0
+    ]
+    index: dict[AreaPurpose | None, tuple[CompiledDefinition, ...]] = {
+        purpose: tuple(
+            c
+            for c in compiled
+            if not c.is_specific or purpose in c.definition.purposes
+        )
+        for purpose in AreaPurpose
+    }
+    index[None] = tuple(c for c in compiled if not c.is_specific)
+    return index
+
+
+# Slack for comparing weight bounds summed in a different order than the
+# actual matched weight, so pruning never drops a definition that could tie.
+_PRUNE_EPSILON = 1e-9
+
+# Candidate definitions per purpose, so detection skips the purpose filter
+# and the total-weight sum on every call. Read-only, as it is shared.
+DEFS_BY_PURPOSE: Mapping[AreaPurpose | None, tuple[CompiledDefinition, ...]] = (
+    MappingProxyType(_build_defs_by_purpose())
+)
+_PURPOSE_AGNOSTIC_DEFS = DEFS_BY_PURPOSE[None]
+
+
+def _score_indicator(
+    indicator: Indicator,
+    key: _SignalKey,
+    weight: float,
+    area: Area,
+    signals: dict[_SignalKey, tuple[float, list[str]] | None],
+) -> tuple[float, list[str]]:
     """Score a single indicator against the area's entities.
 
+    Args:
+        indicator: The indicator to score.
+        key: The indicator's precompiled signal key.
+        weight: The indicator's weight.
+        area: The area whose entities are scored.
+        signals: Per-detection memo of unweighted signals, shared across
+            all definitions scored in the same detect_activity call.
+
     Returns:
         Tuple of (weighted_score, list_of_matching_entity_ids).
-        weighted_score is indicator.weight * match_strength.
+        weighted_score is weight * match_strength.
         Returns (-1.0, []) if no sensors of the required type exist.
     """
-    entities = area.entities.get_entities_by_input_type(indicator.input_type)
-    if not entities:
+    if key in signals:
+        signal = signals[key]
+    else:
+        signal = signals[key] = _indicator_signal(indicator, area)
+
+    if signal is None:
         # No sensor of this type in the area — exclude from scoring.
         return (-1.0, [])
 
+    strength, matched_ids = signal
+    return (weight * strength, matched_ids)
+
+
+def _indicator_signal(
+    indicator: Indicator, area: Area
+) -> tuple[float, list[str]] | None:
+    """Compute the unweighted match strength for an indicator.
+
+    Returns None if no sensors of the required type exist.
+    """
+    entities = area.entities.get_entities_by_input_type(indicator.input_type)
+    if not entities:
+        return None
+
     if indicator.environmental_condition is not None:
         return _score_environmental_indicator(indicator, entities)
 
-    return _score_binary_indicator(indicator, area, entities)
+    return _score_binary_indicator(indicator, entities)
+
+
+# Strengths within this distance of the best count as tied matches.
+_STRENGTH_TOLERANCE = 1e-9
+
+
+def _best_matches(strengths: list[tuple[float, str]]) -> tuple[float, list[str]]:
+    """Return the best strength and the entity IDs that reach it.
+
+    Matches are gathered in a second pass, only once the best strength is
+    known to be positive.
+    """
+    if not strengths:
+        return (0.0, [])
+    best_strength = max(strength for strength, _ in strengths)
+    if best_strength <= 0:
+        return (0.0, [])
+    return (
+        best_strength,
+        [
+            entity_id
+            for strength, entity_id in strengths
+            if best_strength - strength < _STRENGTH_TOLERANCE
+        ],
+    )
 
 
 def _score_binary_indicator(
     indicator: Indicator,
-    area: Area,
-    entities: dict[str, Entity],
+    entities: Mapping[str, Entity],
 ) -> tuple[float, list[str]]:
-    """Score a binary (active/inactive) indicator."""
-    best_strength = 0.0
-    matched_ids: list[str] = []
+    """Score a binary (active/inactive) indicator, unweighted."""
+    strengths: list[tuple[float, str]] = []
 
-    for entity_id, entity in entities.items():
+    for entity in entities.values():
         # Skip entities that don't match required device_class.
         # When all entities are filtered out, this returns (0.0, []) — not
         # (-1.0, []) — because the area *has* sensors of this type, they just
@@ -360,58 +499,72 @@ def _score_binary_indicator(
         else:
             continue
 
-        if strength > best_strength:
-            best_strength = strength
-            matched_ids = [entity_id]
-        elif strength == best_strength and strength > 0:
-            matched_ids.append(entity_id)
+        strengths.append((strength, entity.entity_id))
 
-    return (indicator.weight * best_strength, matched_ids)
+    return _best_matches(strengths)
 
 
 def _score_environmental_indicator(
     indicator: Indicator,
-    entities: dict[str, Entity],
+    entities: Mapping[str, Entity],
 ) -> tuple[float, list[str]]:
-    """Score an environmental (Gaussian-based) indicator."""
-    best_strength = 0.0
-    matched_ids: list[str] = []
+    """Score an environmental (Gaussian-based) indicator, unweighted.
 
-    for entity_id, entity in entities.items():
-        params = getattr(entity, "learned_gaussian_params", None)
-        if params is None:
+    Strength uses learned Gaussian means to determine how far the current
+    value has moved from unoccupied toward occupied (or away, for
+    suppressed), clamped to 0-1.
+    """
+    strengths: list[tuple[float, str]] = []
+
+    # Resolve the condition once rather than per entity.
+    condition = indicator.environmental_condition
+    if condition is None:
+        return (0.0, [])
+    elevated = condition == EnvironmentalCondition.ELEVATED
+
+    for entity in entities.values():
+        # Entity always declares learned_gaussian_params (default None), so a
+        # plain attribute read is safe and avoids getattr's fallback path.
+        params = entity.learned_gaussian_params
+        # Skip entities where means are too close or not statistically
+        # distinguishable (precomputed when the params were learned)
+        if params is None or not params.distinguishable:
             continue
 
         state = entity.state
         if state is None:
             continue
 
-        val: float | None = None
-        with suppress(ValueError, TypeError):
-            val = float(state)
-        if val is None:
-            continue
+        if type(state) is float:
+            val = state
+        else:
+            try:
+                val = float(state)
+            except (ValueError, TypeError):
+                continue
 
-        # Skip entities where means are not statistically distinguishable
-        span = abs(params.mean_occupied - params.mean_unoccupied)
-        avg_std = (params.std_occupied + params.std_unoccupied) / 2
-        if avg_std > 0 and span < avg_std * 0.5:
-            continue
+        mean_unoccupied = params.mean_unoccupied
+        if elevated:
+            position = (val - mean_unoccupied) / params.signed_span
+        else:
+            position = (mean_unoccupied - val) / abs(params.signed_span)
+        strength = max(0.0, min(1.0, position))
 
-        strength = _environmental_signal_strength(
-            val,
-            params.mean_occupied,
-            params.mean_unoccupied,
-            indicator.environmental_condition,
-        )
+        strengths.append((strength, entity.entity_id))
 
-        if strength > best_strength:
-            best_strength = strength
-            matched_ids = [entity_id]
-        elif strength == best_strength and strength > 0:
-            matched_ids.append(entity_id)
+    return _best_matches(strengths)
 
-    return (indicator.weight * best_strength, matched_ids)
+
+@lru_cache(maxsize=32)
+def _evidence_free_activity(
+    activity_id: ActivityId, confidence: float
+) -> DetectedActivity:
+    """Return a shared result for activities that carry no indicators.
+
+    Unoccupied and Idle results depend only on the rounded probability, so
+    repeated detections with an unchanged probability reuse one instance.
+    """
+    return DetectedActivity(activity_id=activity_id, confidence=confidence)
 
 
 def detect_activity(
@@ -431,8 +584,9 @@ def detect_activity(
 
     Algorithm:
     1. If unoccupied, return Unoccupied.
-    2. Filter definitions to matching purposes (empty = any).
-    3. Score each candidate's indicators.
+    2. Look up the precomputed candidates for the purpose (empty = any).
+    3. Score each candidate's indicators, stopping early once the remaining
+       weight cannot reach the thresholds or the current best.
     4. Normalize by total definition weight (sum of all indicator weights).
        Missing sensors naturally reduce the maximum achievable confidence.
     5. Discard below min_match_weight.
@@ -452,27 +606,44 @@ def detect_activity(
     )
 
     if not occupied:
-        return DetectedActivity(
-            activity_id=ActivityId.UNOCCUPIED,
-            confidence=round(1.0 - prob, 4),
-        )
+        return _evidence_free_activity(ActivityId.UNOCCUPIED, round(1.0 - prob, 4))
 
     purpose = area.purpose.purpose
 
     best: DetectedActivity | None = None
     best_matched_weight = 0.0
     best_is_specific = False
+    signals: dict[_SignalKey, tuple[float, list[str]] | None] = {}
 
-    for defn in ACTIVITY_DEFINITIONS:
-        # Filter by purpose (empty purposes = any).
-        if defn.purposes and purpose not in defn.purposes:
-            continue
-
+    # Candidates are pre-filtered by purpose (empty purposes = any).
+    for compiled in DEFS_BY_PURPOSE.get(purpose, _PURPOSE_AGNOSTIC_DEFS):
+        defn = compiled.definition
+        total_weight = compiled.total_weight
         matched_weight = 0.0
         all_matched_ids: list[str] = []
 
-        for indicator in defn.indicators:
-            score, matched_ids = _score_indicator(indicator, area)
+        # Lowest final matched weight that could still pass the thresholds
+        # below and at least tie the current best.
+        required = max(defn.min_match_weight, defn.min_match_weight * total_weight)
+        if best is not None:
+            required = max(required, best.confidence * total_weight)
+        required -= _PRUNE_EPSILON
+
+        pruned = False
+        for indicator, key, weight, remaining in zip(
+            defn.indicators,
+            compiled.signal_keys,
+            compiled.weights,
+            compiled.suffix_weights,
+            strict=True,
+        ):
+            if matched_weight + remaining < required:
+                # Even a full match on every remaining indicator loses.
+                pruned = True
+                break
+            score, matched_ids = _score_indicator(
+                indicator, key, weight, area, signals
+            )
             if score < 0:
                 # No sensor of this type — scores 0, but total weight
                 # still includes it (no inflation from missing sensors).
@@ -480,12 +651,12 @@ def detect_activity(
             matched_weight += score
             all_matched_ids.extend(matched_ids)
 
+        if pruned:
+            continue
+
         # Normalize by total definition weight (always ~1.0), not just
         # the weight of sensors present. Missing sensors naturally reduce
         # the maximum achievable confidence.
-        total_weight = sum(ind.weight for ind in defn.indicators)
-        if total_weight <= 0:
-            continue
 
         # Raw matched weight must meet the minimum threshold to prevent
         # single-sensor false positives after normalization.
@@ -498,7 +669,7 @@ def detect_activity(
 
         # Prefer higher confidence; break ties by purpose-specificity,
         # then by more actual evidence (matched_weight).
-        is_specific = bool(defn.purposes)
+        is_specific = compiled.is_specific
         if (
             best is None
             or confidence > best.confidence
@@ -522,7 +693,4 @@ def detect_activity(
         return best
 
     # No specific activity detected — area is occupied but idle.
-    return DetectedActivity(
-        activity_id=ActivityId.IDLE,
-        confidence=round(prob, 4),
-    )
+    return _evidence_free_activity(ActivityId.IDLE, round(prob, 4))
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import Iterable
+from datetime import datetime, time
 import logging
+import math
+from time import monotonic
 
 from homeassistant.util import dt as dt_util
 
@@ -12,6 +15,8 @@ from .purpose import Purpose
 
 _LOGGER = logging.getLogger(__name__)
 
+_NEG_LN2 = -math.log(2)
+
 
 class Decay:
     """Decay model for Area Occupancy Detection."""
@@ -35,6 +40,8 @@ class Decay:
             sleep_start: Sleep start time string (HH:MM:SS).
             sleep_end: Sleep end time string (HH:MM:SS).
         """
+        self._decay_start: datetime | None = None
+        self._decay_start_monotonic: float | None = None
         # Ensure decay_start is timezone-aware
         if decay_start is not None:
             self.decay_start = to_utc(decay_start)
@@ -42,10 +49,15 @@ class Decay:
             self.decay_start = dt_util.utcnow()
 
         self._base_half_life = half_life
+        # -ln(2) / half_life, recomputed only when the effective half-life changes
+        self._decay_coeff_half_life: float | None = None
+        self._decay_coeff = 0.0
         self.is_decaying = is_decaying
         self._purpose = Purpose(purpose) if purpose is not None else None
-        self.sleep_start = sleep_start
-        self.sleep_end = sleep_end
+        self._sleep_window: tuple[time, time, float] | None = None
+        self._sleep_start = sleep_start
+        self._sleep_end = sleep_end
+        self._parse_sleep_window()
 
     @property
     def purpose(self) -> Purpose | None:
@@ -53,42 +65,100 @@ class Decay:
         return self._purpose
 
     @property
-    def half_life(self) -> float:
-        """Return the effective half-life based on purpose and time of day."""
+    def decay_start(self) -> datetime | None:
+        """Return when decay began (wall clock, used for persistence)."""
+        return self._decay_start
+
+    @decay_start.setter
+    def decay_start(self, value: datetime | None) -> None:
+        """Set when decay began and anchor it on the monotonic clock.
+
+        decay_factor measures age against the monotonic anchor so reads
+        avoid allocating and subtracting datetimes.
+        """
+        self._decay_start = value
+        if value is None:
+            self._decay_start_monotonic = None
+            return
+        elapsed = (dt_util.utcnow() - value).total_seconds()
+        self._decay_start_monotonic = monotonic() - elapsed
+
+    @property
+    def sleep_start(self) -> str | None:
+        """Return the sleep start time string (HH:MM:SS)."""
+        return self._sleep_start
+
+    @sleep_start.setter
+    def sleep_start(self, value: str | None) -> None:
+        """Set the sleep start time and re-parse the sleep window."""
+        self._sleep_start = value
+        self._parse_sleep_window()
+
+    @property
+    def sleep_end(self) -> str | None:
+        """Return the sleep end time string (HH:MM:SS)."""
+        return self._sleep_end
+
+    @sleep_end.setter
+    def sleep_end(self, value: str | None) -> None:
+        """Set the sleep end time and re-parse the sleep window."""
+        self._sleep_end = value
+        self._parse_sleep_window()
+
+    def _parse_sleep_window(self) -> None:
+        """Parse the sleep window once so half_life avoids strptime per call.
+
+        The window holds the parsed start and end times and the purpose's
+        awake half-life. It is left as None when it is not configured, not
+        needed by the purpose, or invalid, and the base half-life applies.
+        """
+        self._sleep_window = None
+
         # If no purpose or purpose has no awake_half_life, use base half-life
-        if self._purpose is None or self._purpose.awake_half_life is None:
-            return self._base_half_life
+        if self._purpose is None:
+            return
+        awake_half_life = self._purpose.awake_half_life
+        if awake_half_life is None:
+            return
 
         # If sleep times are not configured, use base half-life
-        if not self.sleep_start or not self.sleep_end:
-            return self._base_half_life
+        if not self._sleep_start or not self._sleep_end:
+            return
 
         try:
-            # Parse sleep times
-            now = to_local(dt_util.utcnow())
-            start_time = datetime.strptime(self.sleep_start, "%H:%M:%S").time()
-            end_time = datetime.strptime(self.sleep_end, "%H:%M:%S").time()
-
-            current_time = now.time()
-
-            # Check if current time is within sleep window
-            is_sleeping = False
-            if start_time <= end_time:
-                # Same day window (e.g., 13:00 to 15:00)
-                is_sleeping = start_time <= current_time <= end_time
-            else:
-                # Overnight window (e.g., 23:00 to 07:00)
-                is_sleeping = current_time >= start_time or current_time <= end_time
-
-            if is_sleeping:
-                # Use the configured half-life (should be high for sleeping)
-                return self._base_half_life
+            self._sleep_window = (
+                datetime.strptime(self._sleep_start, "%H:%M:%S").time(),
+                datetime.strptime(self._sleep_end, "%H:%M:%S").time(),
+                awake_half_life,
+            )
         except (ValueError, TypeError):
-            _LOGGER.exception("Error calculating half-life for sleeping purpose")
+            _LOGGER.exception("Error parsing sleep window for decay half-life")
+
+    @property
+    def half_life(self) -> float:
+        """Return the effective half-life based on purpose and time of day."""
+        # No purpose-specific awake half-life, or no valid sleep window
+        window = self._sleep_window
+        if window is None:
+            return self._base_half_life
+
+        start_time, end_time, awake_half_life = window
+        current_time = to_local(dt_util.utcnow()).time()
+
+        # Check if current time is within sleep window
+        if start_time <= end_time:
+            # Same day window (e.g., 13:00 to 15:00)
+            is_sleeping = start_time <= current_time <= end_time
+        else:
+            # Overnight window (e.g., 23:00 to 07:00)
+            is_sleeping = current_time >= start_time or current_time <= end_time
+
+        if is_sleeping:
+            # Use the configured half-life (should be high for sleeping)
             return self._base_half_life
 
         # Outside sleep window, use the purpose's awake half-life
-        return self._purpose.awake_half_life
+        return awake_half_life
 
     @property
     def decay_factor(self) -> float:
@@ -99,28 +169,40 @@ class Decay:
         decay factor.
 
         Returns:
-            1.0 if not decaying or decay_start is in the future
+            1.0 if not decaying or decay_start is unset or in the future
             0.0 if half_life is invalid (zero or negative)
             Calculated factor otherwise (0.0 to 1.0)
         """
         if not self.is_decaying:
             return 1.0
+        return self._factor_at(monotonic())
 
-        age = (dt_util.utcnow() - self.decay_start).total_seconds()
+    def _factor_at(self, now: float) -> float:
+        """Return the decay factor at a monotonic timestamp, assuming decaying."""
+        start = self._decay_start_monotonic
+        if start is None:
+            return 1.0
+        age = now - start
 
         # Handle negative age (decay_start in future) - no decay has occurred yet
         if age < 0:
             return 1.0
 
         # Handle zero or negative half_life - prevent division by zero
-        if self.half_life <= 0:
+        half_life = self.half_life
+        if half_life <= 0:
             _LOGGER.warning(
                 "Invalid half_life value %s detected, treating as immediate decay",
-                self.half_life,
+                half_life,
             )
             return 0.0
 
-        factor = float(0.5 ** (age / self.half_life))
+        if half_life != self._decay_coeff_half_life:
+            self._decay_coeff_half_life = half_life
+            self._decay_coeff = _NEG_LN2 / half_life
+
+        # 0.5 ** (age / half_life) == exp(age * -ln(2) / half_life)
+        factor = math.exp(age * self._decay_coeff)
         # Return 0.0 when factor drops below practical threshold
         if factor < 0.05:
             return 0.0
@@ -144,11 +226,25 @@ class Decay:
 
         return factor
 
+    @staticmethod
+    def tick_many(decays: Iterable[Decay]) -> None:
+        """Tick a batch of decays against a single clock reading.
+
+        Equivalent to calling tick() on each, but non-decaying instances are
+        skipped without a property lookup and the monotonic clock is read
+        once for the whole batch.
+        """
+        now = monotonic()
+        for decay in decays:
+            if decay.is_decaying and decay._factor_at(now) <= 0.0:
+                decay.is_decaying = False
+
     def start_decay(self) -> None:
         """Begin decay **only if not already running**."""
         if not self.is_decaying:
             self.is_decaying = True
-            self.decay_start = dt_util.utcnow()
+            self._decay_start = dt_util.utcnow()
+            self._decay_start_monotonic = monotonic()
 
     def stop_decay(self) -> None:
         """Stop decay **only if already running**."""
@@ -1,6 +1,6 @@
 """Entity model."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from contextlib import suppress
 from dataclasses import dataclass
 from datetime import datetime
@@ -18,11 +18,12 @@ from ..const import (
     get_sensor_type_mapping,
 )
 from ..time_utils import to_utc
-from ..utils import map_binary_state_to_semantic
 from .decay import Decay
 from .entity_type import (
     BINARY_INPUT_TYPES,
     DEFAULT_TYPES,
+    ENVIRONMENTAL_INPUT_TYPES,
+    PRESENCE_INPUT_TYPES,
     AnalysisStatus,
     CorrelationType,
     EntityType,
@@ -340,10 +341,8 @@ class Entity:
             return None
 
         if self.active_states:
-            mapped_state = map_binary_state_to_semantic(
-                str(self.state), self.active_states
-            )
-            return mapped_state in self.active_states
+            state = str(self.state)
+            return self.type.state_map.get(state, state) in self.active_states
         if self.active_range:
             min_val, max_val = self.active_range
             try:
@@ -999,6 +998,10 @@ class EntityManager:
         self.hass = coordinator.hass
         self._factory = EntityFactory(coordinator, area_name=area_name)
         self._entities: dict[str, Entity] = self._factory.create_all_from_config()
+        # Lazily built indexes, reset on any membership change
+        self._by_input_type: dict[InputType, dict[str, Entity]] | None = None
+        self._presence_entities: dict[str, Entity] | None = None
+        self._environmental_entities: dict[str, Entity] | None = None
 
     @property
     def entities(self) -> dict[str, Entity]:
@@ -1007,13 +1010,51 @@ class EntityManager:
 
     def get_entities_by_input_type(
         self, input_type: "InputType"
-    ) -> dict[str, "Entity"]:
-        """Get entities filtered by InputType."""
-        return {
-            entity_id: entity
-            for entity_id, entity in self._entities.items()
-            if entity.type.input_type == input_type
-        }
+    ) -> Mapping[str, "Entity"]:
+        """Get entities filtered by InputType.
+
+        Served from a cached index, so the result must not be mutated.
+        """
+        if self._by_input_type is None:
+            index: dict[InputType, dict[str, Entity]] = {}
+            for entity_id, entity in self._entities.items():
+                index.setdefault(entity.type.input_type, {})[entity_id] = entity
+            self._by_input_type = index
+        return self._by_input_type.get(input_type, {})
+
+    @property
+    def presence_entities(self) -> Mapping[str, Entity]:
+        """Get entities whose input type is in PRESENCE_INPUT_TYPES.
+
+        Served from a cached index, so the result must not be mutated.
+        """
+        if self._presence_entities is None:
+            self._presence_entities = {
+                entity_id: entity
+                for entity_id, entity in self._entities.items()
+                if entity.type.input_type in PRESENCE_INPUT_TYPES
+            }
+        return self._presence_entities
+
+    @property
+    def environmental_entities(self) -> Mapping[str, Entity]:
+        """Get entities whose input type is in ENVIRONMENTAL_INPUT_TYPES.
+
+        Served from a cached index, so the result must not be mutated.
+        """
+        if self._environmental_entities is None:
+            self._environmental_entities = {
+                entity_id: entity
+                for entity_id, entity in self._entities.items()
+                if entity.type.input_type in ENVIRONMENTAL_INPUT_TYPES
+            }
+        return self._environmental_entities
+
+    def _invalidate_indexes(self) -> None:
+        """Drop the cached entity indexes after a membership change."""
+        self._by_input_type = None
+        self._presence_entities = None
+        self._environmental_entities = None
 
     @property
     def entity_ids(self) -> list[str]:
@@ -1054,16 +1095,19 @@ class EntityManager:
     def add_entity(self, entity: Entity) -> None:
         """Add an entity to the manager."""
         self._entities[entity.entity_id] = entity
+        self._invalidate_indexes()
 
     def register_entity(self, entity_id: str, input_type: str) -> None:
         """Create and register an entity from a config spec if not already tracked."""
         if entity_id not in self._entities:
             entity = self._factory.create_from_config_spec(entity_id, input_type)
             self._entities[entity_id] = entity
+            self._invalidate_indexes()
 
     def deregister_entity(self, entity_id: str) -> None:
         """Remove an entity from the manager if it exists."""
-        self._entities.pop(entity_id, None)
+        if self._entities.pop(entity_id, None) is not None:
+            self._invalidate_indexes()
 
     async def cleanup(self) -> None:
         """Clean up resources and recreate from config.
@@ -1077,4 +1121,5 @@ class EntityManager:
         self._entities.clear()
         # Recreate entities from config (needed for reconfiguration scenarios)
         self._entities = self._factory.create_all_from_config()
+        self._invalidate_indexes()
         _LOGGER.debug("EntityManager cleanup completed for area: %s", self.area_name)
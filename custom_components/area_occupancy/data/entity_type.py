@@ -15,6 +15,8 @@ from homeassistant.const import (
     STATE_STANDBY,
 )
 
+from ..utils import binary_state_map
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -180,6 +182,9 @@ class EntityType:
         if has_active_states and has_active_range:
             raise ValueError("Cannot provide both active_states and active_range")
 
+        # Binary-to-semantic state table, resolved once per type
+        self.state_map = binary_state_map(self.active_states)
+
         # Set strength multiplier (per-type scaling in logit space)
         self.strength_multiplier = (
             strength_multiplier
@@ -36,6 +36,7 @@ SIGNIFICANT_CHANGE_THRESHOLD = 0.1
 
 # Time slot constants
 DEFAULT_SLOT_MINUTES = 60
+SLOTS_PER_DAY = (24 * 60) // DEFAULT_SLOT_MINUTES
 
 
 class Prior:
@@ -72,8 +73,11 @@ class Prior:
         self.hass = coordinator.hass
         self.global_prior: float | None = None
         self._last_updated: datetime | None = None
-        # Cache for all 168 time priors: (day_of_week, time_slot) -> prior_value
-        self._cached_time_priors: dict[tuple[int, int], float] | None = None
+        # Cache for all 168 time priors, flat-indexed by
+        # day_of_week * SLOTS_PER_DAY + time_slot
+        self._cached_time_priors: list[float] | None = None
+        # Learned (pre-floor) prior for the last (slot index, global prior) seen
+        self._cached_learned: tuple[int, float, float] | None = None
 
     @property
     def value(self) -> float:
@@ -107,13 +111,7 @@ class Prior:
         if self.global_prior is None:
             learned = MIN_PRIOR
         else:
-            if self.time_prior is None:
-                prior = self.global_prior
-            else:
-                prior = combine_priors(self.global_prior, self.time_prior)
-
-            adjusted_prior = prior * PRIOR_FACTOR
-            learned = max(MIN_PRIOR, min(MAX_PRIOR, adjusted_prior))
+            learned = self._learned_prior(self.global_prior)
 
         purpose_floor = 0.0
         area = self.coordinator.areas.get(self.area_name)
@@ -159,19 +157,47 @@ class Prior:
             "threshold": self.config.threshold,
         }
 
+    def _learned_prior(self, global_prior: float) -> float:
+        """Return the combined, clamped learned prior for the current slot.
+
+        The result only changes when the time slot, the global prior or the
+        time-prior table changes, so it is cached between those events.
+        """
+        slot_index = self._current_slot_index()
+        cached = self._cached_learned
+        if (
+            cached is not None
+            and cached[0] == slot_index
+            and cached[1] == global_prior
+        ):
+            return cached[2]
+
+        prior = combine_priors(global_prior, self._time_prior_at(slot_index))
+        adjusted_prior = prior * PRIOR_FACTOR
+        learned = max(MIN_PRIOR, min(MAX_PRIOR, adjusted_prior))
+        self._cached_learned = (slot_index, global_prior, learned)
+        return learned
+
     @property
     def time_prior(self) -> float:
         """Return the current time prior value or minimum if not calculated."""
+        return self._time_prior_at(self._current_slot_index())
+
+    def _time_prior_at(self, slot_index: int) -> float:
+        """Return the time prior for a flat slot index."""
         # Load all time priors if cache is empty
         if self._cached_time_priors is None:
             self._load_time_priors()
 
-        current_day = self.day_of_week
-        current_slot = self.time_slot
-        slot_key = (current_day, current_slot)
-
         # Get from cache (guaranteed to exist after _load_time_priors)
-        return self._cached_time_priors.get(slot_key, DEFAULT_TIME_PRIOR)
+        return self._cached_time_priors[slot_index]
+
+    @staticmethod
+    def _current_slot_index() -> int:
+        """Return the flat time-prior index for now from a single clock read."""
+        now = to_local(dt_util.utcnow())
+        time_slot = (now.hour * 60 + now.minute) // DEFAULT_SLOT_MINUTES
+        return now.weekday() * SLOTS_PER_DAY + time_slot
 
     @property
     def day_of_week(self) -> int:
@@ -212,20 +238,29 @@ class Prior:
     def _invalidate_time_prior_cache(self) -> None:
         """Invalidate the time_prior cache."""
         self._cached_time_priors = None
+        self._cached_learned = None
 
     def _load_time_priors(self) -> None:
         """Load all 168 time priors from database into cache.
 
         This method loads time priors for the area in a single database query,
         eliminating the need for individual queries when accessing time priors.
+        Priors are stored in a flat list so lookups index by integer instead
+        of hashing a (day_of_week, time_slot) tuple.
         """
-        self._cached_time_priors = self.db.get_all_time_priors(
+        default = max(
+            TIME_PRIOR_MIN_BOUND, min(TIME_PRIOR_MAX_BOUND, DEFAULT_TIME_PRIOR)
+        )
+        cached = [default] * (7 * SLOTS_PER_DAY)
+        time_priors = self.db.get_all_time_priors(
             area_name=self.area_name,
             default_prior=DEFAULT_TIME_PRIOR,
         )
         # Apply safety bounds to all cached values
-        for slot_key, prior_value in self._cached_time_priors.items():
-            self._cached_time_priors[slot_key] = max(
-                TIME_PRIOR_MIN_BOUND,
-                min(TIME_PRIOR_MAX_BOUND, prior_value),
-            )
+        for (day_of_week, time_slot), prior_value in time_priors.items():
+            if 0 <= day_of_week < 7 and 0 <= time_slot < SLOTS_PER_DAY:
+                cached[day_of_week * SLOTS_PER_DAY + time_slot] = max(
+                    TIME_PRIOR_MIN_BOUND,
+                    min(TIME_PRIOR_MAX_BOUND, prior_value),
+                )
+        self._cached_time_priors = cached
@@ -2,21 +2,51 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GaussianParams:
-    """Learned Gaussian distribution parameters for numeric sensor likelihoods."""
+    """Learned Gaussian distribution parameters for numeric sensor likelihoods.
+
+    ``signed_span`` and ``distinguishable`` are derived once at construction
+    so activity scoring does not recompute them for every reading.
+    """
 
     mean_occupied: float
     std_occupied: float
     mean_unoccupied: float
     std_unoccupied: float
+    # mean_occupied - mean_unoccupied
+    signed_span: float = field(init=False, repr=False, compare=False)
+    # Whether the means are far enough apart, relative to the spread, for a
+    # reading to say anything about occupancy
+    distinguishable: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Derive the span and distinguishability of the two distributions."""
+        signed_span = self.mean_occupied - self.mean_unoccupied
+        span = abs(signed_span)
+        avg_std = (self.std_occupied + self.std_unoccupied) / 2
+        object.__setattr__(self, "signed_span", signed_span)
+        object.__setattr__(
+            self,
+            "distinguishable",
+            span >= 1e-9 and not (avg_std > 0 and span < avg_std * 0.5),
+        )
+
+    def to_dict(self) -> dict[str, float]:
+        """Return the learned parameters, without derived fields."""
+        return {
+            "mean_occupied": self.mean_occupied,
+            "std_occupied": self.std_occupied,
+            "mean_unoccupied": self.mean_unoccupied,
+            "std_unoccupied": self.std_unoccupied,
+        }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnvironmentalData:
     """Captured environmental sensor readings at a point in time."""
 
@@ -28,7 +58,7 @@ class EnvironmentalData:
     voc: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EnvironmentalAnalysisResult:
     """Result of environmental analysis for occupancy detection."""
 
@@ -27,7 +27,7 @@ from ..const import (
 )
 from ..data.entity_type import CorrelationType, InputType
 from ..time_utils import from_db_utc, to_db_utc, to_local, to_utc
-from ..utils import clamp_probability, map_binary_state_to_semantic
+from ..utils import binary_state_map, clamp_probability
 from .utils import (
     get_occupied_intervals_for_analysis,
     is_timestamp_occupied,
@@ -417,6 +417,7 @@ def analyze_binary_likelihoods(
             seconds_active_and_unoccupied = 0.0
             found_active_intervals = False
             unique_states = set()
+            state_map = binary_state_map(active_states)
 
             for interval in binary_intervals:
                 interval_start = from_db_utc(interval.start_time)
@@ -433,9 +434,7 @@ def analyze_binary_likelihoods(
                 unique_states.add(interval.state)
 
                 # Map binary state to semantic state if needed (e.g., 'off'/'on' → 'closed'/'open')
-                mapped_state = map_binary_state_to_semantic(
-                    interval.state, active_states
-                )
+                mapped_state = state_map.get(interval.state, interval.state)
 
                 # Check if sensor is active (using mapped state)
                 is_active = mapped_state in active_states
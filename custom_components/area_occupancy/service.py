@@ -1,7 +1,6 @@
 """Service definitions for the Area Occupancy Detection integration."""
 
 import contextlib
-from dataclasses import asdict
 import logging
 import time
 from typing import TYPE_CHECKING, Any
@@ -100,7 +99,7 @@ def _collect_likelihood_data(area: "Area") -> dict[str, dict[str, Any]]:
 
         # Always include analysis data and errors (even if None) for visibility
         gaussian_params = getattr(entity, "learned_gaussian_params", None)
-        analysis_data = asdict(gaussian_params) if gaussian_params else None
+        analysis_data = gaussian_params.to_dict() if gaussian_params else None
         analysis_error = getattr(entity, "analysis_error", None)
         correlation_type = getattr(entity, "correlation_type", None)
 
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import lru_cache
 import logging
 import math
+from time import monotonic
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import HomeAssistant
@@ -14,10 +18,16 @@ from .const import DOMAIN, MAX_PROBABILITY, MIN_PROBABILITY, ROUNDING_PRECISION
 
 _LOGGER = logging.getLogger(__name__)
 
+# Minimum seconds between repeats of the same hot-path warning
+_WARNING_INTERVAL = 60.0
+# Warning key -> (monotonic time last emitted, repeats suppressed since)
+_warning_state: dict[str, tuple[float, int]] = {}
+
 
 if TYPE_CHECKING:
     from .coordinator import AreaOccupancyCoordinator
     from .data.entity import Entity
+    from .data.entity_type import InputType
 
 
 def format_float(value: float) -> float:
@@ -39,7 +49,7 @@ def is_valid_number(value: float) -> bool:
     Returns:
         True if value is finite and not NaN, False otherwise
     """
-    return not (math.isnan(value) or math.isinf(value))
+    return math.isfinite(value)
 
 
 def clamp_probability(
@@ -55,24 +65,69 @@ def clamp_probability(
     Returns:
         Clamped probability value (always a valid finite number)
     """
-    # Handle NaN and infinity values explicitly
-    if not is_valid_number(value):
-        if math.isinf(value):
-            if value > 0:
-                # Positive infinity -> clamp to MAX_PROBABILITY
-                return max_val if max_val is not None else MAX_PROBABILITY
-            # Negative infinity -> clamp to MIN_PROBABILITY
-            return min_val if min_val is not None else MIN_PROBABILITY
-        # NaN -> clamp to MAX_PROBABILITY (matching existing test behavior)
-        _LOGGER.warning(
-            "clamp_probability received invalid value (NaN): %s, using MAX_PROBABILITY",
-            value,
-        )
-        return max_val if max_val is not None else MAX_PROBABILITY
-
     min_bound = min_val if min_val is not None else MIN_PROBABILITY
     max_bound = max_val if max_val is not None else MAX_PROBABILITY
-    return max(min_bound, min(max_bound, value))
+
+    # Common case first: an in-range value. NaN fails every comparison and
+    # falls through; infinities are caught by the bound checks.
+    if min_bound <= value <= max_bound:
+        return value
+    if value > max_bound:
+        return max_bound
+    if value < min_bound:
+        return min_bound
+
+    # NaN -> clamp to MAX_PROBABILITY (matching existing test behavior)
+    _warn_rate_limited(
+        "clamp_probability",
+        "clamp_probability received invalid value (NaN): %s, using MAX_PROBABILITY",
+        value,
+    )
+    return max_bound
+
+
+def _warn_rate_limited(key: str, msg: str, *args: Any) -> None:
+    """Log a warning at most once per _WARNING_INTERVAL for each key.
+
+    Used on per-update paths where a broken sensor would otherwise repeat
+    the same warning on every recalculation. Suppressed repeats are counted
+    and reported with the next emitted warning.
+    """
+    now = monotonic()
+    last, suppressed = _warning_state.get(key, (-math.inf, 0))
+    if now - last < _WARNING_INTERVAL:
+        _warning_state[key] = (last, suppressed + 1)
+        return
+    _warning_state[key] = (now, 0)
+    if suppressed:
+        msg += " (%d similar warnings suppressed)"
+        args = (*args, suppressed)
+    _LOGGER.warning(msg, *args)
+
+
+# For doors and windows: 'off' means closed, 'on' means open
+_SEMANTIC_STATE_MAP: Mapping[str, str] = MappingProxyType(
+    {"off": "closed", "on": "open"}
+)
+_NO_STATE_MAP: Mapping[str, str] = MappingProxyType({})
+
+
+def binary_state_map(active_states: list[str] | None) -> Mapping[str, str]:
+    """Return the binary-to-semantic state table for a set of active states.
+
+    Active states are fixed per entity type, so callers resolve the table
+    once and map each state with ``table.get(state, state)``.
+
+    Args:
+        active_states: List of active states expected by the config
+
+    Returns:
+        The 'on'/'off' → 'open'/'closed' table if active_states uses semantic
+        states, otherwise an empty mapping
+    """
+    if active_states and ("closed" in active_states or "open" in active_states):
+        return _SEMANTIC_STATE_MAP
+    return _NO_STATE_MAP
 
 
 def map_binary_state_to_semantic(state: str, active_states: list[str]) -> str:
@@ -88,17 +143,7 @@ def map_binary_state_to_semantic(state: str, active_states: list[str]) -> str:
     Returns:
         The mapped state if mapping is needed, otherwise the original state
     """
-    # If active_states contains semantic states, map binary states
-    if "closed" in active_states or "open" in active_states:
-        # Map binary states to semantic states
-        # For doors: 'off' means closed, 'on' means open
-        # For windows: 'off' means closed, 'on' means open
-        if state == "off":
-            return "closed"
-        if state == "on":
-            return "open"
-    # No mapping needed, return original state
-    return state
+    return binary_state_map(active_states).get(state, state)
 
 
 # ────────────────────────────────────── Sigmoid Functions ───────────────────────────
@@ -107,6 +152,9 @@ def map_binary_state_to_semantic(state: str, active_states: list[str]) -> str:
 def sigmoid(z: float) -> float:
     """Compute sigmoid function with numerical stability.
 
+    The sign split keeps the math.exp argument non-positive, so it never
+    overflows and needs a single exp per call; +/-inf map to 1.0/0.0.
+
     Args:
         z: Input value (log-odds)
 
@@ -123,6 +171,9 @@ def sigmoid(z: float) -> float:
 def logit(p: float) -> float:
     """Compute logit (inverse sigmoid) with bounds protection.
 
+    Evaluated as ``log(p) - log1p(-p)``, which avoids forming ``1 - p``
+    explicitly and stays accurate near the clamp bounds.
+
     Args:
         p: Probability value
 
@@ -130,11 +181,35 @@ def logit(p: float) -> float:
         Log-odds value
     """
     p = clamp_probability(p)  # Ensure 0.01-0.99 range
-    return math.log(p / (1 - p))
+    return math.log(p) - math.log1p(-p)
+
+
+@lru_cache(maxsize=64)
+def _prior_logit(prior: float) -> float:
+    """Return logit(prior), memoized.
+
+    Learned priors change on the order of minutes to hours while
+    probabilities are recomputed on every state change, so the same few
+    prior values recur across calls.
+    """
+    return logit(prior)
+
+
+def _logit_mix(p_a: float, weight_a: float, p_b: float, weight_b: float) -> float:
+    """Blend two probabilities by weighted average in logit space.
+
+    Inputs must already be clamped to (0, 1), so the logits are taken
+    directly instead of re-clamping through logit().
+
+    Returns:
+        sigmoid(weight_a * logit(p_a) + weight_b * logit(p_b)), clamped
+    """
+    z = weight_a * math.log(p_a / (1 - p_a)) + weight_b * math.log(p_b / (1 - p_b))
+    return clamp_probability(sigmoid(z))
 
 
 def sigmoid_probability(
-    entities: dict[str, Entity],
+    entities: Mapping[str, Entity],
     prior: float = 0.5,
     correlations: dict[str, float] | None = None,
 ) -> float:
@@ -158,7 +233,7 @@ def sigmoid_probability(
 
     # Start with bias from prior (logit transforms prior to log-odds space)
     # logit(0.5) = 0, logit(0.7) = 0.85, logit(0.3) = -0.85
-    bias = logit(prior)
+    bias = _prior_logit(prior)
 
     # Sum weighted contributions from all entities
     z = bias
@@ -167,11 +242,6 @@ def sigmoid_probability(
         if entity.weight <= 0:
             continue
 
-        # Get correlation multiplier (learned or default)
-        correlation = 1.0
-        if correlations and entity_id in correlations:
-            correlation = correlations[entity_id]
-
         # Determine evidence contribution
         # Active = full contribution, Decaying = partial, Inactive = zero
         if entity.evidence is True:
@@ -179,30 +249,51 @@ def sigmoid_probability(
         elif entity.decay.is_decaying:
             evidence = entity.decay_factor  # Gradual fade (0.0 to 1.0)
         else:
-            evidence = 0.0  # Inactive = no contribution (not negative!)
+            # Inactive = no contribution (not negative!), so skip the
+            # per-entity weight and strength lookups entirely
+            continue
+
+        # Get correlation multiplier (learned or default)
+        correlation = correlations.get(entity_id, 1.0) if correlations else 1.0
 
         # Scale by sensor type strength (prob_given_true indicates signal strength)
-        # Motion (0.95) contributes more than door (0.2)
-        strength = entity.prob_given_true
+        # Motion (0.95) contributes more than door (0.2).
+        # strength_multiplier is per-type (e.g., 3.0 for motion, 2.0 for others)
+        # to give ground-truth sensors a stronger logit-space contribution.
+        strength_factor = entity.prob_given_true * entity.type.strength_multiplier
 
         # Use effective_weight (weight × information_gain) so uninformative sensors
-        # contribute less. Falls back to weight if effective_weight is not available.
-        ew = getattr(entity, "effective_weight", entity.weight)
+        # contribute less. Entity always defines it, so read it directly rather
+        # than through getattr with an eagerly evaluated weight fallback.
+        ew = entity.effective_weight
 
         # Add to z: effective_weight × evidence × correlation × strength_factor.
-        # strength_multiplier is per-type (e.g., 3.0 for motion, 2.0 for others)
-        # to give ground-truth sensors a stronger logit-space contribution.
-        strength_multiplier = getattr(entity.type, "strength_multiplier", 2.0)
-        contribution = ew * evidence * correlation * (strength * strength_multiplier)
-        z += contribution
+        z += ew * evidence * correlation * strength_factor
 
     return clamp_probability(sigmoid(z))
 
 
+@lru_cache(maxsize=1)
+def _input_type_groups() -> tuple[set[InputType], set[InputType]]:
+    """Return the (presence, environmental) input type sets.
+
+    data.entity_type imports this module, so the import is deferred to the
+    first call and the result cached for the rest.
+    """
+    from .data.entity_type import (  # noqa: PLC0415
+        ENVIRONMENTAL_INPUT_TYPES,
+        PRESENCE_INPUT_TYPES,
+    )
+
+    return PRESENCE_INPUT_TYPES, ENVIRONMENTAL_INPUT_TYPES
+
+
 def presence_probability(
-    entities: dict[str, Entity],
+    entities: Mapping[str, Entity],
     prior: float = 0.5,
     correlations: dict[str, float] | None = None,
+    *,
+    filtered: bool = False,
 ) -> float:
     """Calculate presence probability from strong binary indicators.
 
@@ -214,17 +305,21 @@ def presence_probability(
         entities: Dict of Entity objects
         prior: Learned prior probability for this area
         correlations: Optional dict of entity_id -> correlation strength
+        filtered: True if entities already holds only presence sensors
+            (e.g. EntityManager.presence_entities), skipping the filter
 
     Returns:
         Probability in range MIN_PROBABILITY to MAX_PROBABILITY
     """
-    from .data.entity_type import PRESENCE_INPUT_TYPES  # noqa: PLC0415
-
-    presence_entities = {
-        eid: e
-        for eid, e in entities.items()
-        if e.type.input_type in PRESENCE_INPUT_TYPES
-    }
+    if filtered:
+        presence_entities = entities
+    else:
+        presence_types = _input_type_groups()[0]
+        presence_entities = {
+            eid: e
+            for eid, e in entities.items()
+            if e.type.input_type in presence_types
+        }
 
     if not presence_entities:
         # No presence sensors - return reduced prior (uncertain state)
@@ -234,8 +329,10 @@ def presence_probability(
 
 
 def environmental_confidence(
-    entities: dict[str, Entity],
+    entities: Mapping[str, Entity],
     correlations: dict[str, float] | None = None,
+    *,
+    filtered: bool = False,
 ) -> float:
     """Calculate environmental support as 0-1 confidence.
 
@@ -245,17 +342,21 @@ def environmental_confidence(
     Args:
         entities: Dict of Entity objects
         correlations: Optional dict of entity_id -> correlation strength
+        filtered: True if entities already holds only environmental sensors
+            (e.g. EntityManager.environmental_entities), skipping the filter
 
     Returns:
         Confidence value 0.0-1.0 (0.5 = neutral, >0.5 = supports, <0.5 = opposes)
     """
-    from .data.entity_type import ENVIRONMENTAL_INPUT_TYPES  # noqa: PLC0415
-
-    env_entities = {
-        eid: e
-        for eid, e in entities.items()
-        if e.type.input_type in ENVIRONMENTAL_INPUT_TYPES
-    }
+    if filtered:
+        env_entities = entities
+    else:
+        env_types = _input_type_groups()[1]
+        env_entities = {
+            eid: e
+            for eid, e in entities.items()
+            if e.type.input_type in env_types
+        }
 
     if not env_entities:
         return 0.5  # Neutral - no environmental data
@@ -280,14 +381,11 @@ def combined_probability(
     Returns:
         Combined probability in range MIN_PROBABILITY to MAX_PROBABILITY
     """
-    # Convert to logit space for principled combination
-    z_presence = logit(presence)
-    z_env = logit(environmental)
-
-    # Weighted combination (presence dominates at 80%, environmental at 20%)
-    z_combined = 0.8 * z_presence + 0.2 * z_env
-
-    return clamp_probability(sigmoid(z_combined))
+    # Weighted combination in logit space for principled combination
+    # (presence dominates at 80%, environmental at 20%)
+    return _logit_mix(
+        clamp_probability(presence), 0.8, clamp_probability(environmental), 0.2
+    )
 
 
 def apply_activity_boost(
@@ -312,12 +410,43 @@ def apply_activity_boost(
     """
     effective_boost = activity_boost * activity_confidence
     if effective_boost <= 0:
+        # No activity detected (the common case)
+        if MIN_PROBABILITY <= base_probability <= MAX_PROBABILITY:
+            return base_probability
         return clamp_probability(base_probability)
+    if base_probability >= MAX_PROBABILITY:
+        # Any positive boost from the ceiling clamps back to the ceiling
+        return MAX_PROBABILITY
     z = logit(base_probability) + effective_boost
     return clamp_probability(sigmoid(z))
 
 
 # ────────────────────────────────────── Core Bayes ───────────────────────────
+def _is_continuous(entity: Entity) -> bool:
+    """Return whether an entity uses continuous (Gaussian density) likelihoods.
+
+    Continuous likelihoods are probability densities and can be > 1.0.
+    Uses a guarded getattr to be safe with Mocks, which can return Mocks
+    for attributes.
+    """
+    is_continuous = getattr(entity, "is_continuous_likelihood", False)
+    return is_continuous if isinstance(is_continuous, bool) else False
+
+
+def _entity_likelihoods_valid(entity: Entity) -> bool:
+    """Check an entity's likelihoods are finite and within range for its type."""
+    p_t = entity.prob_given_true
+    p_f = entity.prob_given_false
+    # isfinite also rejects NaN, which comparison operators don't catch
+    if not (math.isfinite(p_t) and math.isfinite(p_f)):
+        return False
+    if _is_continuous(entity):
+        # Densities can be > 1.0, so only check > 0
+        return p_t > 0.0 and p_f > 0.0
+    # Standard probabilities must lie strictly within (0, 1)
+    return 0.0 < p_t < 1.0 and 0.0 < p_f < 1.0
+
+
 def _filter_invalid_entity_likelihoods(
     active_entities: dict[str, Entity],
 ) -> dict[str, Entity]:
@@ -329,43 +458,11 @@ def _filter_invalid_entity_likelihoods(
     Returns:
         Dictionary of entities with valid likelihoods
     """
-    entities_to_remove = []
-    for entity_id, entity in active_entities.items():
-        # Check if entity uses continuous likelihood (densities can be > 1.0)
-        is_continuous = getattr(entity, "is_continuous_likelihood", False)
-        if not isinstance(is_continuous, bool):
-            is_continuous = False
-
-        # Validate likelihoods based on sensor type
-        # First check for NaN/inf explicitly (comparison operators don't catch NaN)
-        if not is_valid_number(entity.prob_given_true) or not is_valid_number(
-            entity.prob_given_false
-        ):
-            # Mark entities with NaN/inf likelihoods for removal
-            entities_to_remove.append(entity_id)
-            continue
-
-        if is_continuous:
-            # For continuous likelihoods (densities), only check > 0
-            # Densities can be > 1.0, so we don't check upper bound
-            if entity.prob_given_true <= 0.0 or entity.prob_given_false <= 0.0:
-                # Mark entities with invalid likelihoods for removal
-                entities_to_remove.append(entity_id)
-        # For standard probabilities, validate [0, 1] range
-        elif (
-            entity.prob_given_true <= 0.0
-            or entity.prob_given_true >= 1.0
-            or entity.prob_given_false <= 0.0
-            or entity.prob_given_false >= 1.0
-        ):
-            # Mark entities with invalid likelihoods for removal
-            entities_to_remove.append(entity_id)
-
-    # Remove invalid entities after iteration
-    for entity_id in entities_to_remove:
-        active_entities.pop(entity_id, None)
-
-    return active_entities
+    return {
+        entity_id: entity
+        for entity_id, entity in active_entities.items()
+        if _entity_likelihoods_valid(entity)
+    }
 
 
 def _get_entity_likelihoods(
@@ -381,40 +478,49 @@ def _get_entity_likelihoods(
     Returns:
         Tuple of (p_t, p_f) or None if entity should be skipped
     """
+    # Resolve the dynamic likelihood method once (for Gaussian sensors).
+    # Ensure it is callable (Mocks make everything callable but check anyway)
+    get_likelihoods = None
+    if is_continuous:
+        get_likelihoods = getattr(entity, "get_likelihoods", None)
+        if not callable(get_likelihoods):
+            get_likelihoods = None
+
     if effective_evidence:
         # Evidence is present (either current or decaying) - use likelihoods
         # Use dynamic likelihoods if available (for Gaussian sensors)
-        if is_continuous and hasattr(entity, "get_likelihoods"):
-            # Ensure get_likelihoods is callable (Mocks make everything callable but check anyway)
-            if callable(entity.get_likelihoods):
-                p_t, p_f = entity.get_likelihoods()
-                # Validate return values for NaN/inf
-                if not is_valid_number(p_t) or not is_valid_number(p_f):
-                    # Fallback to static values if get_likelihoods() returned invalid values
-                    _LOGGER.warning(
-                        "get_likelihoods() returned invalid values (NaN/inf) for %s, using static probabilities",
-                        entity.entity_id if hasattr(entity, "entity_id") else "unknown",
-                    )
-                    p_t = entity.prob_given_true
-                    p_f = entity.prob_given_false
-                    # If static values are also invalid, skip this entity
-                    if not is_valid_number(p_t) or not is_valid_number(p_f):
-                        return None
-                return (p_t, p_f)
-            return (entity.prob_given_true, entity.prob_given_false)
+        if get_likelihoods is not None:
+            p_t, p_f = get_likelihoods()
+            # Validate return values for NaN/inf
+            if not (math.isfinite(p_t) and math.isfinite(p_f)):
+                # Fallback to static values if get_likelihoods() returned invalid values
+                entity_id = getattr(entity, "entity_id", "unknown")
+                _warn_rate_limited(
+                    f"likelihoods:{entity_id}",
+                    "get_likelihoods() returned invalid values (NaN/inf) for %s, using static probabilities",
+                    entity_id,
+                )
+                p_t = entity.prob_given_true
+                p_f = entity.prob_given_false
+                # If static values are also invalid, skip this entity
+                if not (math.isfinite(p_t) and math.isfinite(p_f)):
+                    return None
+            return (p_t, p_f)
         return (entity.prob_given_true, entity.prob_given_false)
 
     # No evidence present
     if is_continuous:
         # For continuous sensors with no effective evidence, use get_likelihoods()
-        if hasattr(entity, "get_likelihoods") and callable(entity.get_likelihoods):
-            p_t, p_f = entity.get_likelihoods()
+        if get_likelihoods is not None:
+            p_t, p_f = get_likelihoods()
             # Validate return values for NaN/inf
-            if not is_valid_number(p_t) or not is_valid_number(p_f):
+            if not (math.isfinite(p_t) and math.isfinite(p_f)):
                 # Fallback to neutral values if get_likelihoods() returned invalid values
-                _LOGGER.warning(
+                entity_id = getattr(entity, "entity_id", "unknown")
+                _warn_rate_limited(
+                    f"likelihoods:{entity_id}",
                     "get_likelihoods() returned invalid values (NaN/inf) for %s, using neutral values",
-                    entity.entity_id if hasattr(entity, "entity_id") else "unknown",
+                    entity_id,
                 )
                 # Can't use inverse for densities, so use neutral values
                 return (0.5, 0.5)
@@ -478,9 +584,10 @@ def bayesian_probability(entities: dict[str, Entity], prior: float = 0.5) -> flo
     # Clamp prior
     prior = clamp_probability(prior)
 
-    # log-space for numerical stability
-    log_true = math.log(prior)
-    log_false = math.log(1 - prior)
+    # Accumulate posterior log-odds. Only log P(true) - log P(false) affects
+    # the result, so each entity adds ew * log(p_t / p_f): one log per entity
+    # instead of separate true/false sums.
+    log_odds = _prior_logit(prior)
 
     for entity in active_entities.values():
         value = entity.evidence
@@ -503,12 +610,7 @@ def bayesian_probability(entities: dict[str, Entity], prior: float = 0.5) -> flo
         effective_evidence = value or is_decaying
 
         # Check if entity supports continuous likelihood (Gaussian density)
-        # Continuous likelihoods are probability densities and can be > 1.0
-        # Use simple getattr to be safe with Mocks
-        is_continuous = getattr(entity, "is_continuous_likelihood", False)
-        # Verify it's actually a boolean and True (Mocks can return Mocks for attributes)
-        if not isinstance(is_continuous, bool):
-            is_continuous = False
+        is_continuous = _is_continuous(entity)
 
         # Get likelihoods for this entity
         likelihoods = _get_entity_likelihoods(entity, is_continuous, effective_evidence)
@@ -531,28 +633,12 @@ def bayesian_probability(entities: dict[str, Entity], prior: float = 0.5) -> flo
             p_t = clamp_probability(p_t)
             p_f = clamp_probability(p_f)
 
-        log_p_t = math.log(p_t)
-        log_p_f = math.log(p_f)
         # Use effective_weight so uninformative sensors contribute less.
-        ew = getattr(entity, "effective_weight", entity.weight)
-        contribution_true = log_p_t * ew
-        contribution_false = log_p_f * ew
-
-        log_true += contribution_true
-        log_false += contribution_false
-
-    # convert back
-    max_log = max(log_true, log_false)
-    true_prob = math.exp(log_true - max_log)
-    false_prob = math.exp(log_false - max_log)
+        ew = entity.effective_weight
+        log_odds += math.log(p_t / p_f) * ew
 
-    # Handle numerical overflow/underflow edge case
-    total_prob = true_prob + false_prob
-    if total_prob == 0.0:
-        # Both probabilities are zero - return prior as fallback
-        return prior
-
-    return clamp_probability(true_prob / total_prob)
+    # Convert back: sigmoid(log_odds) == P(true) / (P(true) + P(false))
+    return clamp_probability(sigmoid(log_odds))
 
 
 def combine_priors(
@@ -608,14 +694,7 @@ def combine_priors(
     area_weight = 1.0 - time_weight
 
     # Interpolate in logit space for more principled combination
-    area_logit = logit(area_prior)
-    time_logit = logit(time_prior)
-
-    # Weighted combination in logit space
-    combined_logit = area_weight * area_logit + time_weight * time_logit
-    combined_prior = sigmoid(combined_logit)
-
-    return clamp_probability(combined_prior)
+    return _logit_mix(area_prior, area_weight, time_prior, time_weight)
 
 
 # ────────────────────────────────────── Coordinator Utilities ───────────────────────────
@@ -682,6 +761,12 @@ def extract_device_identifier_from_device_info(device_info: DeviceInfo) -> str |
     return None
 
 
+@lru_cache(maxsize=1024)
+def _normalize_entity_name(entity_name: str) -> str:
+    """Normalize an entity name constant for use in a unique_id."""
+    return entity_name.lower().replace(" ", "_")
+
+
 def generate_entity_unique_id(
     entry_id: str,
     device_info: DeviceInfo | dict[str, Any] | None,
@@ -701,6 +786,4 @@ def generate_entity_unique_id(
     if device_id is None:
         device_id = entry_id
 
-    normalized_name = entity_name.lower().replace(" ", "_")
-
-    return f"{entry_id}_{device_id}_{normalized_name}"
+    return f"{entry_id}_{device_id}_{_normalize_entity_name(entity_name)}"
@@ -25,6 +25,37 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_STEP_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_AREA_NAME): str,
+        vol.Optional(CONF_ICON): selector.IconSelector(
+            selector.IconSelectorConfig(placeholder=DEFAULT_ICON)
+        ),
+        vol.Optional(CONF_POWER_ENTITY): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="sensor")
+        ),
+        vol.Optional(CONF_ENERGY_ENTITY): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="sensor")
+        ),
+        vol.Optional(CONF_TEMP_ENTITY): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="sensor")
+        ),
+        vol.Optional(CONF_HUMIDITY_ENTITY): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="sensor")
+        ),
+        vol.Optional(CONF_MOTION_ENTITY): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="binary_sensor")
+        ),
+        vol.Optional(CONF_WINDOW_ENTITY): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="binary_sensor")
+        ),
+        vol.Optional(CONF_CLIMATE_ENTITY): selector.EntitySelector(
+            selector.EntitySelectorConfig(domain="climate")
+        ),
+        vol.Optional(CONF_ACTIVE_THRESHOLD): vol.All(vol.Coerce(float), vol.Range(min=0)),
+    }
+)
+
 
 class AreasConfigFlow(
     config_entries.ConfigFlow, domain=DOMAIN
@@ -58,35 +89,6 @@ class AreasConfigFlow(
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_AREA_NAME): str,
-                    vol.Optional(CONF_ICON): selector.IconSelector(
-                        selector.IconSelectorConfig(placeholder="mdi:texture-box")
-                    ),
-                    vol.Optional(CONF_POWER_ENTITY): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="sensor")
-                    ),
-                    vol.Optional(CONF_ENERGY_ENTITY): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="sensor")
-                    ),
-                    vol.Optional(CONF_TEMP_ENTITY): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="sensor")
-                    ),
-                    vol.Optional(CONF_HUMIDITY_ENTITY): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="sensor")
-                    ),
-                    vol.Optional(CONF_MOTION_ENTITY): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="binary_sensor")
-                    ),
-                    vol.Optional(CONF_WINDOW_ENTITY): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="binary_sensor")
-                    ),
-                    vol.Optional(CONF_CLIMATE_ENTITY): selector.EntitySelector(
-                        selector.EntitySelectorConfig(domain="climate")
-                    ),
-                    vol.Optional(CONF_ACTIVE_THRESHOLD): vol.All(vol.Coerce(float), vol.Range(min=0)),
-                }
-            ),
+            data_schema=_STEP_USER_SCHEMA,
             errors=errors,
         )  # pyright: ignore[reportReturnType]
@@ -1,42 +1,26 @@
 """Sensor platform for Custom Areas Integration."""
 
+import asyncio
 import logging
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, STATE_IDLE, STATE_ON, STATE_UNKNOWN
-from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.const import (
+    PERCENTAGE,
+    STATE_IDLE,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    UnitOfEnergy,
+    UnitOfPower,
+    UnitOfTemperature,
+)
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.event import async_track_state_change_event
 
-# Try to import unit constants, fall back to local definitions if not available
-try:
-    from homeassistant.util.unit_conversion import UnitOfEnergy, UnitOfPower
-    from homeassistant.util.unit_system import UnitOfTemperature
-
-    UNIT_CELSIUS: str = UnitOfTemperature.CELSIUS
-    UNIT_HUMIDITY: str = PERCENTAGE
-    UNIT_WATT: str = UnitOfPower.WATT
-    UNIT_WATT_HOUR: str = UnitOfEnergy.WATT_HOUR
-except ImportError:
-    # Fallback for older versions or if unit system constants don't exist
-    try:
-        from homeassistant.const import ENERGY_WATT_HOUR  # pyright: ignore[reportAttributeAccessIssue]
-        from homeassistant.const import POWER_WATT  # pyright: ignore[reportAttributeAccessIssue]
-        from homeassistant.const import TEMP_CELSIUS  # pyright: ignore[reportAttributeAccessIssue]
-
-        UNIT_CELSIUS = TEMP_CELSIUS
-        UNIT_WATT = POWER_WATT
-        UNIT_WATT_HOUR = ENERGY_WATT_HOUR
-    except ImportError:
-        # Final fallback for versions where these constants don't exist
-        UNIT_CELSIUS = "°C"  # pyright: ignore[reportAssignmentType]
-        UNIT_HUMIDITY = "%"  # pyright: ignore[reportAssignmentType]
-        UNIT_WATT = "W"  # pyright: ignore[reportAssignmentType]
-        UNIT_WATT_HOUR = "Wh"  # pyright: ignore[reportAssignmentType]
-
 from .const import (
     CONF_ACTIVE_THRESHOLD,
     CONF_AREA_NAME,
@@ -58,6 +42,35 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+UNIT_CELSIUS: str = UnitOfTemperature.CELSIUS
+UNIT_HUMIDITY: str = PERCENTAGE
+UNIT_WATT: str = UnitOfPower.WATT
+UNIT_WATT_HOUR: str = UnitOfEnergy.WATT_HOUR
+
+# States that never parse as a number
+_NON_NUMERIC_STATES = frozenset({STATE_UNKNOWN, STATE_UNAVAILABLE, ""})
+
+# Config keys of the source entities an area tracks
+_TRACKED_KEYS = (
+    CONF_POWER_ENTITY,
+    CONF_ENERGY_ENTITY,
+    CONF_TEMP_ENTITY,
+    CONF_HUMIDITY_ENTITY,
+    CONF_MOTION_ENTITY,
+    CONF_WINDOW_ENTITY,
+    CONF_CLIMATE_ENTITY,
+)
+
+
+# Summary attribute name, source config key and default unit of each
+# measurement shown on the area summary sensor
+_MEASUREMENT_ATTRIBUTES = (
+    ("power", CONF_POWER_ENTITY, UNIT_WATT),
+    ("energy", CONF_ENERGY_ENTITY, UNIT_WATT_HOUR),
+    ("temperature", CONF_TEMP_ENTITY, UNIT_CELSIUS),
+    ("humidity", CONF_HUMIDITY_ENTITY, UNIT_HUMIDITY),
+)
+
 
 def get_numeric_state(hass: HomeAssistant, entity_id: str) -> Optional[float]:
     """Get numeric state from entity.
@@ -68,20 +81,42 @@ def get_numeric_state(hass: HomeAssistant, entity_id: str) -> Optional[float]:
     if not entity_id:
         return None
 
-    state = hass.states.get(entity_id)
-    if state:
+    return _state_to_float(hass.states.get(entity_id))
+
+
+def _state_to_float(state: Optional[State]) -> Optional[float]:
+    """Parse a State's value as a float, or None if it has no numeric value."""
+    # Unknown/unavailable are common; skip raising and catching for them
+    if state and state.state not in _NON_NUMERIC_STATES:
         try:
             return float(state.state)
         except (ValueError, TypeError) as err:
             _LOGGER.debug(
                 "Failed to convert state %s for entity %s: %s",
                 state.state,
-                entity_id,
+                state.entity_id,
                 err,
             )
     return None
 
 
+def _numeric_and_unit(state: Optional[State], default_unit: str) -> Tuple[Optional[float], str]:
+    """Get a state's numeric value and its unit, or default_unit if it has none."""
+    if state is None:
+        return None, default_unit
+    return _state_to_float(state), state.attributes.get("unit_of_measurement", default_unit)
+
+
+def _suggested_object_id(data: Dict[str, Any], suffix: str = "") -> Optional[str]:
+    """Build a sensor's suggested object_id from the area name.
+
+    The area name is fixed for the life of the config entry, so sensors
+    compute this once at construction.
+    """
+    area_name = str(data.get(CONF_AREA_NAME, "")).strip()
+    return f"custom_area_{area_name}{suffix}" if area_name else None
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -94,27 +129,27 @@ async def async_setup_entry(
     entities: list[SensorEntity] = [summary_sensor]
 
     # Create measurement sensors conditionally
-    if config_entry.data.get(CONF_POWER_ENTITY):
+    if coordinator.entity_ids.get(CONF_POWER_ENTITY):
         power_sensor = PowerSensor(coordinator, config_entry)
         entities.append(power_sensor)
         summary_sensor.power_sensor = power_sensor
 
-    if config_entry.data.get(CONF_ENERGY_ENTITY):
+    if coordinator.entity_ids.get(CONF_ENERGY_ENTITY):
         energy_sensor = EnergySensor(coordinator, config_entry)
         entities.append(energy_sensor)
         summary_sensor.energy_sensor = energy_sensor
 
-    if config_entry.data.get(CONF_TEMP_ENTITY):
+    if coordinator.entity_ids.get(CONF_TEMP_ENTITY):
         temperature_sensor = TemperatureSensor(coordinator, config_entry)
         entities.append(temperature_sensor)
         summary_sensor.temperature_sensor = temperature_sensor
 
-    if config_entry.data.get(CONF_HUMIDITY_ENTITY):
+    if coordinator.entity_ids.get(CONF_HUMIDITY_ENTITY):
         humidity_sensor = HumiditySensor(coordinator, config_entry)
         entities.append(humidity_sensor)
         summary_sensor.humidity_sensor = humidity_sensor
 
-    if config_entry.data.get(CONF_CLIMATE_ENTITY):
+    if coordinator.entity_ids.get(CONF_CLIMATE_ENTITY):
         climate_target_sensor = ClimateTargetSensor(coordinator, config_entry)
         entities.append(climate_target_sensor)
         summary_sensor.climate_target_sensor = climate_target_sensor
@@ -129,56 +164,91 @@ class AreaSensorCoordinator:
         """Initialize the coordinator."""
         self.hass = hass
         self.config_entry = config_entry
-        self._listeners: list[Callable[..., Any]] = []
-        self._sensors: list[SensorEntity] = []
+        # Plain-dict snapshot of the entry data; an options change reloads the
+        # entry, which builds a new coordinator
+        self.data: Dict[str, Any] = dict(config_entry.data)
+        # Device shared by every sensor of this area
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+            name=f"Area: {self.data[CONF_AREA_NAME]}",
+            manufacturer="Areas Integration",
+            model="Area Sensor",
+        )
+        # Configured source entity ids by config key, resolved once
+        self.entity_ids: Dict[str, str] = {
+            key: entity_id for key in _TRACKED_KEYS if (entity_id := self.data.get(key))
+        }
+        self._unsub_state_listener: Optional[CALLBACK_TYPE] = None
+        # Registered sensors by the source entity ids they depend on
+        self._sensors_by_entity: Dict[str, list[SensorEntity]] = {}
+        # Sensors awaiting the pending coalesced write, in registration order
+        self._pending_sensors: Dict[SensorEntity, None] = {}
+        self._flush_handle: Optional[asyncio.Handle] = None
 
     async def async_config_entry_first_refresh(self) -> None:
         """Set up state change listeners."""
-        _LOGGER.debug("Setting up state change listeners for entities")
-        entities_to_track = []
-
-        # Add core entities
-        for key in [
-            CONF_POWER_ENTITY,
-            CONF_ENERGY_ENTITY,
-            CONF_TEMP_ENTITY,
-            CONF_HUMIDITY_ENTITY,
-            CONF_MOTION_ENTITY,
-            CONF_WINDOW_ENTITY,
-            CONF_CLIMATE_ENTITY,
-        ]:
-            entity_id = self.config_entry.data.get(key)
-            if entity_id:
-                entities_to_track.append(entity_id)
+        entities_to_track = list(self.entity_ids.values())
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Setting up state change listeners for entities")
+            for entity_id in entities_to_track:
                 _LOGGER.debug("Will track entity: %s", entity_id)
-
-        _LOGGER.debug("Total entities to track: %d", len(entities_to_track))
+            _LOGGER.debug("Total entities to track: %d", len(entities_to_track))
 
         if entities_to_track:
-            _LOGGER.debug(
-                "Calling async_track_state_change_event with entities: %s",
-                entities_to_track,
+            if debug:
+                _LOGGER.debug(
+                    "Calling async_track_state_change_event with entities: %s",
+                    entities_to_track,
+                )
+            self._unsub_state_listener = async_track_state_change_event(
+                self.hass, entities_to_track, self._handle_state_change
             )
-            listener = async_track_state_change_event(self.hass, entities_to_track, self._handle_state_change)
-            self._listeners.append(listener)  # pyright: ignore[reportArgumentType]
-            _LOGGER.debug("Successfully registered state change listener")
+            if debug:
+                _LOGGER.debug("Successfully registered state change listener")
 
     @callback
     def _handle_state_change(self, event: Event) -> None:
-        """Handle state change events."""
-        # Update all registered sensors
-        for sensor in self._sensors:
-            sensor.async_schedule_update_ha_state()  # pyright: ignore[reportUnusedCoroutine]
-        return
+        """Handle state change events.
 
-    def register_sensor(self, sensor: SensorEntity) -> None:
-        """Register a sensor."""
-        self._sensors.append(sensor)
+        Only sensors that depend on the changed entity are updated. Several
+        tracked entities often change in the same loop iteration, so writes
+        are coalesced into one per sensor on the next iteration.
+        """
+        sensors = self._sensors_by_entity.get(event.data["entity_id"])
+        if not sensors:
+            return
+        self._pending_sensors.update(dict.fromkeys(sensors))
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_soon(self._flush_updates)
+
+    @callback
+    def _flush_updates(self) -> None:
+        """Write the state of sensors whose sources changed."""
+        self._flush_handle = None
+        pending, self._pending_sensors = self._pending_sensors, {}
+        for sensor in pending:
+            if isinstance(sensor, MeasurementSensor):
+                sensor.async_refresh_from_source()
+            sensor.async_write_ha_state()
+
+    def register_sensor(self, sensor: SensorEntity, watches: Optional[Iterable[str]] = None) -> None:
+        """Register a sensor for updates when any of the watched entities change.
+
+        Sensors that don't name their sources watch every tracked entity.
+        """
+        for entity_id in self.entity_ids.values() if watches is None else watches:
+            self._sensors_by_entity.setdefault(entity_id, []).append(sensor)
 
     def async_shutdown(self):
         """Clean up listeners."""
-        for listener in self._listeners:
-            listener()
+        if self._unsub_state_listener is not None:
+            self._unsub_state_listener()
+            self._unsub_state_listener = None
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_sensors.clear()
 
 
 class AreaSummarySensor(SensorEntity):
@@ -189,9 +259,20 @@ class AreaSummarySensor(SensorEntity):
         self.coordinator = coordinator
         self.config_entry = config_entry
         # Display name (friendly): just the area name
-        self._attr_name = str(config_entry.data.get(CONF_AREA_NAME, ""))
+        area_name = coordinator.data.get(CONF_AREA_NAME, "")
+        self._attr_name = str(area_name) if area_name else ""
+        self._suggested_object_id = _suggested_object_id(coordinator.data)
         self._attr_unique_id = f"custom_area_{config_entry.entry_id}_summary"
         self._attr_should_poll = False
+        self._active_threshold = coordinator.data.get(CONF_ACTIVE_THRESHOLD, DEFAULT_ACTIVE_THRESHOLD)
+        # Configured icon, shown when neither window nor motion is active
+        icon_value = coordinator.data.get(CONF_ICON, DEFAULT_ICON)
+        self._icon = str(icon_value) if icon_value is not None else DEFAULT_ICON
+
+        # Attributes are rebuilt only when a tracked source state changes
+        self._tracked_entity_ids = tuple(coordinator.entity_ids.values())
+        self._attrs_key: Optional[tuple] = None
+        self._attrs_cache: Dict[str, Any] = {}
 
         # References to measurement sensors
         self.power_sensor: Optional["PowerSensor"] = None
@@ -204,18 +285,7 @@ class AreaSummarySensor(SensorEntity):
         coordinator.register_sensor(self)
 
         # Set up device info
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.entry_id)},
-            name=f"Area: {config_entry.data[CONF_AREA_NAME]}",
-            manufacturer="Areas Integration",
-            model="Area Sensor",
-        )
-
-    @property
-    def name(self) -> str:
-        """Return the name of the sensor (display name without area_ prefix)."""
-        area_name = self.config_entry.data.get(CONF_AREA_NAME, "")
-        return str(area_name) if area_name else ""
+        self._attr_device_info = coordinator.device_info
 
     @property
     def suggested_object_id(self) -> Optional[str]:
@@ -223,372 +293,269 @@ class AreaSummarySensor(SensorEntity):
 
         Home Assistant will slugify this into the final object_id.
         """
-        area_name = str(self.config_entry.data.get(CONF_AREA_NAME, "")).strip()
-        return f"custom_area_{area_name}" if area_name else None
+        return self._suggested_object_id
 
     @property
     def state(self) -> str:
         """Return the state of the sensor."""
-        data = self.config_entry.data
+        entity_ids = self.coordinator.entity_ids
 
         # Check motion first
-        motion_entity = data.get(CONF_MOTION_ENTITY)
+        motion_entity = entity_ids.get(CONF_MOTION_ENTITY)
         if motion_entity:
             motion_state = self.hass.states.get(motion_entity)
             if motion_state and motion_state.state == STATE_ON:
                 return STATE_ACTIVE
 
         # Check power threshold
-        power_entity = data.get(CONF_POWER_ENTITY)
-        active_threshold = data.get(CONF_ACTIVE_THRESHOLD, DEFAULT_ACTIVE_THRESHOLD)
+        power_entity = entity_ids.get(CONF_POWER_ENTITY)
         if power_entity:
-            power_state = self.hass.states.get(power_entity)
-            if power_state:
-                try:
-                    power_value = float(power_state.state)
-                    if power_value > active_threshold:
-                        return STATE_ACTIVE
-                except (ValueError, TypeError):
-                    pass
+            power_value = _state_to_float(self.hass.states.get(power_entity))
+            if power_value is not None and power_value > self._active_threshold:
+                return STATE_ACTIVE
 
         # Check if any core entities exist
-        core_entities = [
-            data.get(CONF_POWER_ENTITY),
-            data.get(CONF_ENERGY_ENTITY),
-            data.get(CONF_TEMP_ENTITY),
-            data.get(CONF_HUMIDITY_ENTITY),
-            data.get(CONF_MOTION_ENTITY),
-            data.get(CONF_WINDOW_ENTITY),
-            data.get(CONF_CLIMATE_ENTITY),
-        ]
-
-        if any(entity for entity in core_entities if entity):
-            return str(STATE_IDLE)
+        if entity_ids:
+            return STATE_IDLE
 
-        return str(STATE_UNKNOWN)
+        return STATE_UNKNOWN
 
     @property
     def icon(self) -> str:
         """Return the icon."""
-        data = self.config_entry.data
+        entity_ids = self.coordinator.entity_ids
 
         # Check window first
-        window_entity = data.get(CONF_WINDOW_ENTITY)
+        window_entity = entity_ids.get(CONF_WINDOW_ENTITY)
         if window_entity:
             window_state = self.hass.states.get(window_entity)
             if window_state and window_state.state == STATE_ON:
                 return ICON_WINDOW_OPEN
 
         # Check motion
-        motion_entity = data.get(CONF_MOTION_ENTITY)
+        motion_entity = entity_ids.get(CONF_MOTION_ENTITY)
         if motion_entity:
             motion_state = self.hass.states.get(motion_entity)
             if motion_state and motion_state.state == STATE_ON:
                 return ICON_MOTION
 
         # Return configured icon or default
-        icon_value = data.get(CONF_ICON, DEFAULT_ICON)
-        return str(icon_value) if icon_value is not None else DEFAULT_ICON
+        return self._icon
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
-        """Return the state attributes."""
-        attrs: Dict[str, Any] = {}
-        data = self.config_entry.data
-
-        # Cache state lookups for performance
-        cached_states = {}
+        """Return the state attributes.
 
-        def get_cached_state(entity_id: str):
-            """Get state with caching to avoid multiple lookups."""
-            if entity_id not in cached_states:
-                cached_states[entity_id] = self.hass.states.get(entity_id)
-            return cached_states[entity_id]
+        HA replaces a State object whenever it changes, so the tuple of
+        current source states identifies the inputs; the last result is
+        reused until one of them is replaced.
+        """
+        key = tuple(self.hass.states.get(entity_id) for entity_id in self._tracked_entity_ids)
+        if key != self._attrs_key:
+            # Source states by config key, from the lookups made for the key
+            self._attrs_cache = self._build_attributes(dict(zip(self.coordinator.entity_ids, key)))
+            self._attrs_key = key
+        return self._attrs_cache
+
+    @staticmethod
+    def _build_attributes(states: Dict[str, Optional[State]]) -> Dict[str, Any]:
+        """Build the state attributes from the configured sources' states.
+
+        Args:
+            states: Current state of each configured source by config key
+                (None if the entity has no state)
+        """
+        attrs: Dict[str, Any] = {}
 
         # Binary sensor attributes (motion, window, climate mode)
-        motion_entity = data.get(CONF_MOTION_ENTITY)
-        if motion_entity:
-            motion_state = get_cached_state(motion_entity)
+        if CONF_MOTION_ENTITY in states:
+            motion_state = states[CONF_MOTION_ENTITY]
             attrs["occupied"] = motion_state.state == STATE_ON if motion_state else False
 
-        window_entity = data.get(CONF_WINDOW_ENTITY)
-        if window_entity:
-            window_state = get_cached_state(window_entity)
+        if CONF_WINDOW_ENTITY in states:
+            window_state = states[CONF_WINDOW_ENTITY]
             attrs["window_open"] = window_state.state == STATE_ON if window_state else False
 
-        climate_entity = data.get(CONF_CLIMATE_ENTITY)
-        if climate_entity:
-            climate_state = get_cached_state(climate_entity)
-            if climate_state:
-                attrs["climate_mode"] = climate_state.state
+        climate_state = states.get(CONF_CLIMATE_ENTITY)
+        if climate_state:
+            attrs["climate_mode"] = climate_state.state
 
         # Measurement attributes
-        power_entity = data.get(CONF_POWER_ENTITY)
-        if power_entity:
-            power_value = get_numeric_state(self.hass, power_entity)
-            if power_value is not None:
-                power_state = self.hass.states.get(power_entity)
-                unit = power_state.attributes.get("unit_of_measurement") if power_state else UNIT_WATT
-                attrs["power"] = f"{power_value} {unit}"
-
-        energy_entity = data.get(CONF_ENERGY_ENTITY)
-        if energy_entity:
-            energy_value = get_numeric_state(self.hass, energy_entity)
-            if energy_value is not None:
-                energy_state = self.hass.states.get(energy_entity)
-                unit = energy_state.attributes.get("unit_of_measurement") if energy_state else UNIT_WATT_HOUR
-                attrs["energy"] = f"{energy_value} {unit}"
-
-        temp_entity = data.get(CONF_TEMP_ENTITY)
-        if temp_entity:
-            temp_value = get_numeric_state(self.hass, temp_entity)
-            if temp_value is not None:
-                temp_state = self.hass.states.get(temp_entity)
-                unit = temp_state.attributes.get("unit_of_measurement") if temp_state else UNIT_CELSIUS
-                attrs["temperature"] = f"{temp_value} {unit}"
-
-        humidity_entity = data.get(CONF_HUMIDITY_ENTITY)
-        if humidity_entity:
-            humidity_value = get_numeric_state(self.hass, humidity_entity)
-            if humidity_value is not None:
-                humidity_state = self.hass.states.get(humidity_entity)
-                unit = humidity_state.attributes.get("unit_of_measurement") if humidity_state else UNIT_HUMIDITY
-                attrs["humidity"] = f"{humidity_value} {unit}"
-
-        climate_entity = data.get(CONF_CLIMATE_ENTITY)
-        if climate_entity:
-            climate_state = self.hass.states.get(climate_entity)
-            if climate_state and climate_state.attributes.get("temperature"):
-                try:
-                    target_value = float(climate_state.attributes["temperature"])
-                    unit = climate_state.attributes.get("unit_of_measurement") or UNIT_CELSIUS
-                    attrs["climate_target"] = f"{target_value} {unit}"
-                except (ValueError, TypeError):
-                    pass
+        for attr_name, key, default_unit in _MEASUREMENT_ATTRIBUTES:
+            if key in states:
+                value, unit = _numeric_and_unit(states[key], default_unit)
+                if value is not None:
+                    attrs[attr_name] = f"{value} {unit}"
+
+        if climate_state and climate_state.attributes.get("temperature"):
+            try:
+                target_value = float(climate_state.attributes["temperature"])
+                unit = climate_state.attributes.get("unit_of_measurement") or UNIT_CELSIUS
+                attrs["climate_target"] = f"{target_value} {unit}"
+            except (ValueError, TypeError):
+                pass
 
         return attrs
 
 
-class PowerSensor(SensorEntity):
+class MeasurementSensor(SensorEntity):
+    """Base for sensors mirroring a numeric value from one source entity.
+
+    The coordinator pushes the source value into _attr_native_value when
+    the source changes, so state reads are plain attribute loads.
+    """
+
+    coordinator: AreaSensorCoordinator
+    _source_key: str
+    _default_unit: str
+
+    def _source_entity_ids(self) -> Tuple[str, ...]:
+        """Return the source entity id to watch, if configured."""
+        entity_id = self.coordinator.entity_ids.get(self._source_key)
+        return (entity_id,) if entity_id else ()
+
+    async def async_added_to_hass(self) -> None:
+        """Load the current source value before the first state write."""
+        self.async_refresh_from_source()
+
+    @callback
+    def async_refresh_from_source(self) -> None:
+        """Update the native value and unit from the source entity."""
+        entity_id = self.coordinator.entity_ids.get(self._source_key)
+        state = self.coordinator.hass.states.get(entity_id) if entity_id else None
+        self._attr_native_value = self._native_value_from(state)
+        unit = state.attributes.get("unit_of_measurement") if state else None
+        self._attr_native_unit_of_measurement = unit or self._default_unit
+
+    def _native_value_from(self, state: Optional[State]) -> Optional[float]:
+        """Return the sensor value for the source state."""
+        return _state_to_float(state)
+
+
+class PowerSensor(MeasurementSensor):
     """Power measurement sensor."""
 
+    _source_key = CONF_POWER_ENTITY
+    _default_unit = UNIT_WATT
+
     def __init__(self, coordinator: AreaSensorCoordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         self.coordinator = coordinator
         self.config_entry = config_entry
-        area_name = str(config_entry.data.get(CONF_AREA_NAME, ""))
+        area_name = str(coordinator.data.get(CONF_AREA_NAME, ""))
         self._attr_name = f"{area_name} Power"
         self._attr_unique_id = f"custom_area_{config_entry.entry_id}_power"
+        self._suggested_object_id = _suggested_object_id(coordinator.data, "_power")
         self._attr_should_poll = False
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.entry_id)},
-            name=f"Area: {config_entry.data[CONF_AREA_NAME]}",
-            manufacturer="Areas Integration",
-            model="Area Sensor",
-        )
-        coordinator.register_sensor(self)
+        self._attr_device_info = coordinator.device_info
+        coordinator.register_sensor(self, self._source_entity_ids())
 
     @property
     def suggested_object_id(self) -> Optional[str]:
         """Suggest object_id."""
-        area_name = str(self.config_entry.data.get(CONF_AREA_NAME, "")).strip()
-        return f"custom_area_{area_name}_power" if area_name else None
-
-    @property
-    def state(self) -> Optional[float]:
-        """Return the state of the sensor."""
-        power_entity = self.config_entry.data.get(CONF_POWER_ENTITY)
-        if power_entity:
-            return get_numeric_state(self.hass, power_entity)
-        return None
-
-    @property
-    def unit_of_measurement(self) -> Optional[str]:
-        """Return the unit of measurement."""
-        power_entity = self.config_entry.data.get(CONF_POWER_ENTITY)
-        if power_entity:
-            state = self.hass.states.get(power_entity)
-            if state and state.attributes.get("unit_of_measurement"):
-                return state.attributes["unit_of_measurement"]  # type: ignore[no-any-return]
-        return UNIT_WATT
+        return self._suggested_object_id
 
 
-class EnergySensor(SensorEntity):
+class EnergySensor(MeasurementSensor):
     """Energy measurement sensor."""
 
+    _source_key = CONF_ENERGY_ENTITY
+    _default_unit = UNIT_WATT_HOUR
+
     def __init__(self, coordinator: AreaSensorCoordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         self.coordinator = coordinator
         self.config_entry = config_entry
-        area_name = str(config_entry.data.get(CONF_AREA_NAME, ""))
+        area_name = str(coordinator.data.get(CONF_AREA_NAME, ""))
         self._attr_name = f"{area_name} Energy"
         self._attr_unique_id = f"custom_area_{config_entry.entry_id}_energy"
+        self._suggested_object_id = _suggested_object_id(coordinator.data, "_energy")
         self._attr_should_poll = False
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.entry_id)},
-            name=f"Area: {config_entry.data[CONF_AREA_NAME]}",
-            manufacturer="Areas Integration",
-            model="Area Sensor",
-        )
-        coordinator.register_sensor(self)
+        self._attr_device_info = coordinator.device_info
+        coordinator.register_sensor(self, self._source_entity_ids())
 
     @property
     def suggested_object_id(self) -> Optional[str]:
         """Suggest object_id."""
-        area_name = str(self.config_entry.data.get(CONF_AREA_NAME, "")).strip()
-        return f"custom_area_{area_name}_energy" if area_name else None
+        return self._suggested_object_id
 
-    @property
-    def state(self) -> Optional[float]:
-        """Return the state of the sensor."""
-        energy_entity = self.config_entry.data.get(CONF_ENERGY_ENTITY)
-        if energy_entity:
-            return get_numeric_state(self.hass, energy_entity)
-        return None
 
-    @property
-    def unit_of_measurement(self) -> Optional[str]:
-        """Return the unit of measurement."""
-        energy_entity = self.config_entry.data.get(CONF_ENERGY_ENTITY)
-        if energy_entity:
-            state = self.hass.states.get(energy_entity)
-            if state and state.attributes.get("unit_of_measurement"):
-                return state.attributes["unit_of_measurement"]  # type: ignore[no-any-return]
-        return UNIT_WATT_HOUR
-
-
-class TemperatureSensor(SensorEntity):
+class TemperatureSensor(MeasurementSensor):
     """Temperature measurement sensor."""
 
+    _source_key = CONF_TEMP_ENTITY
+    _default_unit = UNIT_CELSIUS
+
     def __init__(self, coordinator: AreaSensorCoordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         self.coordinator = coordinator
         self.config_entry = config_entry
-        area_name = str(config_entry.data.get(CONF_AREA_NAME, ""))
+        area_name = str(coordinator.data.get(CONF_AREA_NAME, ""))
         self._attr_name = f"{area_name} Temperature"
         self._attr_unique_id = f"custom_area_{config_entry.entry_id}_temperature"
+        self._suggested_object_id = _suggested_object_id(coordinator.data, "_temperature")
         self._attr_should_poll = False
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.entry_id)},
-            name=f"Area: {config_entry.data[CONF_AREA_NAME]}",
-            manufacturer="Areas Integration",
-            model="Area Sensor",
-        )
-        coordinator.register_sensor(self)
+        self._attr_device_info = coordinator.device_info
+        coordinator.register_sensor(self, self._source_entity_ids())
 
     @property
     def suggested_object_id(self) -> Optional[str]:
         """Suggest object_id."""
-        area_name = str(self.config_entry.data.get(CONF_AREA_NAME, "")).strip()
-        return f"custom_area_{area_name}_temperature" if area_name else None
-
-    @property
-    def state(self) -> Optional[float]:
-        """Return the state of the sensor."""
-        temp_entity = self.config_entry.data.get(CONF_TEMP_ENTITY)
-        if temp_entity:
-            return get_numeric_state(self.hass, temp_entity)
-        return None
-
-    @property
-    def unit_of_measurement(self) -> Optional[str]:
-        """Return the unit of measurement."""
-        temp_entity = self.config_entry.data.get(CONF_TEMP_ENTITY)
-        if temp_entity:
-            state = self.hass.states.get(temp_entity)
-            if state and state.attributes.get("unit_of_measurement"):
-                return state.attributes["unit_of_measurement"]  # type: ignore[no-any-return]
-        return UNIT_CELSIUS
+        return self._suggested_object_id
 
 
-class HumiditySensor(SensorEntity):
+class HumiditySensor(MeasurementSensor):
     """Humidity measurement sensor."""
 
+    _source_key = CONF_HUMIDITY_ENTITY
+    _default_unit = UNIT_HUMIDITY
+
     def __init__(self, coordinator: AreaSensorCoordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         self.coordinator = coordinator
         self.config_entry = config_entry
-        area_name = str(config_entry.data.get(CONF_AREA_NAME, ""))
+        area_name = str(coordinator.data.get(CONF_AREA_NAME, ""))
         self._attr_name = f"{area_name} Humidity"
         self._attr_unique_id = f"custom_area_{config_entry.entry_id}_humidity"
+        self._suggested_object_id = _suggested_object_id(coordinator.data, "_humidity")
         self._attr_should_poll = False
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.entry_id)},
-            name=f"Area: {config_entry.data[CONF_AREA_NAME]}",
-            manufacturer="Areas Integration",
-            model="Area Sensor",
-        )
-        coordinator.register_sensor(self)
+        self._attr_device_info = coordinator.device_info
+        coordinator.register_sensor(self, self._source_entity_ids())
 
     @property
     def suggested_object_id(self) -> Optional[str]:
         """Suggest object_id."""
-        area_name = str(self.config_entry.data.get(CONF_AREA_NAME, "")).strip()
-        return f"custom_area_{area_name}_humidity" if area_name else None
-
-    @property
-    def state(self) -> Optional[float]:
-        """Return the state of the sensor."""
-        humidity_entity = self.config_entry.data.get(CONF_HUMIDITY_ENTITY)
-        if humidity_entity:
-            return get_numeric_state(self.hass, humidity_entity)
-        return None
-
-    @property
-    def unit_of_measurement(self) -> Optional[str]:
-        """Return the unit of measurement."""
-        humidity_entity = self.config_entry.data.get(CONF_HUMIDITY_ENTITY)
-        if humidity_entity:
-            state = self.hass.states.get(humidity_entity)
-            if state and state.attributes.get("unit_of_measurement"):
-                return state.attributes["unit_of_measurement"]  # type: ignore[no-any-return]
-        return UNIT_HUMIDITY
+        return self._suggested_object_id
 
 
-class ClimateTargetSensor(SensorEntity):
+class ClimateTargetSensor(MeasurementSensor):
     """Climate target temperature sensor."""
 
+    _source_key = CONF_CLIMATE_ENTITY
+    _default_unit = UNIT_CELSIUS
+
     def __init__(self, coordinator: AreaSensorCoordinator, config_entry: ConfigEntry) -> None:
         """Initialize the sensor."""
         self.coordinator = coordinator
         self.config_entry = config_entry
-        area_name = str(config_entry.data.get(CONF_AREA_NAME, ""))
+        area_name = str(coordinator.data.get(CONF_AREA_NAME, ""))
         self._attr_name = f"{area_name} Climate Target"
         self._attr_unique_id = f"custom_area_{config_entry.entry_id}_climate_target"
+        self._suggested_object_id = _suggested_object_id(coordinator.data, "_climate_target")
         self._attr_should_poll = False
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, config_entry.entry_id)},
-            name=f"Area: {config_entry.data[CONF_AREA_NAME]}",
-            manufacturer="Areas Integration",
-            model="Area Sensor",
-        )
-        coordinator.register_sensor(self)
+        self._attr_device_info = coordinator.device_info
+        coordinator.register_sensor(self, self._source_entity_ids())
 
     @property
     def suggested_object_id(self) -> Optional[str]:
         """Suggest object_id."""
-        area_name = str(self.config_entry.data.get(CONF_AREA_NAME, "")).strip()
-        return f"custom_area_{area_name}_climate_target" if area_name else None
-
-    @property
-    def state(self) -> Optional[float]:
-        """Return the state of the sensor."""
-        climate_entity = self.config_entry.data.get(CONF_CLIMATE_ENTITY)
-        if climate_entity:
-            climate_state = self.hass.states.get(climate_entity)
-            if climate_state and climate_state.attributes.get("temperature"):
-                try:
-                    return float(climate_state.attributes["temperature"])
-                except (ValueError, TypeError):
-                    pass
+        return self._suggested_object_id
+
+    def _native_value_from(self, state: Optional[State]) -> Optional[float]:
+        """Return the climate entity's target temperature."""
+        if state and state.attributes.get("temperature"):
+            try:
+                return float(state.attributes["temperature"])
+            except (ValueError, TypeError):
+                pass
         return None
-
-    @property
-    def unit_of_measurement(self) -> Optional[str]:
-        """Return the unit of measurement."""
-        climate_entity = self.config_entry.data.get(CONF_CLIMATE_ENTITY)
-        if climate_entity:
-            state = self.hass.states.get(climate_entity)
-            if state and state.attributes.get("unit_of_measurement"):
-                return state.attributes["unit_of_measurement"]  # type: ignore[no-any-return]
-        return UNIT_CELSIUS
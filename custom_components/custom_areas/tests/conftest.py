@@ -0,0 +1,63 @@
+"""Fixtures for the Custom Areas Integration tests."""
+
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.custom_areas.const import (
+    CONF_ACTIVE_THRESHOLD,
+    CONF_AREA_NAME,
+    CONF_CLIMATE_ENTITY,
+    CONF_ENERGY_ENTITY,
+    CONF_HUMIDITY_ENTITY,
+    CONF_MOTION_ENTITY,
+    CONF_POWER_ENTITY,
+    CONF_TEMP_ENTITY,
+    CONF_WINDOW_ENTITY,
+)
+from custom_components.custom_areas.sensor import AreaSensorCoordinator, AreaSummarySensor
+
+
+# Shared by every mock entry; read-only so a test cannot leak changes into the next
+_DEFAULT_ENTRY_DATA = MappingProxyType(
+    {
+        CONF_AREA_NAME: "Test Area",
+        CONF_POWER_ENTITY: "sensor.power",
+        CONF_ENERGY_ENTITY: "sensor.energy",
+        CONF_TEMP_ENTITY: "sensor.temperature",
+        CONF_HUMIDITY_ENTITY: "sensor.humidity",
+        CONF_MOTION_ENTITY: "binary_sensor.motion",
+        CONF_WINDOW_ENTITY: "binary_sensor.window",
+        CONF_CLIMATE_ENTITY: "climate.thermostat",
+        CONF_ACTIVE_THRESHOLD: 50.0,
+    }
+)
+
+
+@pytest.fixture
+def mock_config_entry():
+    """Mock config entry."""
+    return SimpleNamespace(entry_id="test_entry_id", data=_DEFAULT_ENTRY_DATA)
+
+
+@pytest.fixture
+def mock_hass():
+    """Mock Home Assistant."""
+    return SimpleNamespace(states=SimpleNamespace(get=MagicMock(return_value=None)))
+
+
+@pytest.fixture
+def mock_coordinator(mock_hass, mock_config_entry):
+    """Mock coordinator."""
+    coordinator = AreaSensorCoordinator(mock_hass, mock_config_entry)
+    return coordinator
+
+
+@pytest.fixture
+def summary_sensor(mock_coordinator, mock_config_entry, mock_hass):
+    """Area summary sensor bound to the mock hass."""
+    sensor = AreaSummarySensor(mock_coordinator, mock_config_entry)
+    sensor.hass = mock_hass
+    return sensor
+
@@ -1,25 +1,13 @@
 """Test the Custom Areas Integration sensors."""
 
-import sys
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
-from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_IDLE, STATE_OFF, STATE_ON, STATE_UNKNOWN
-from homeassistant.core import HomeAssistant
-
-from custom_components.custom_areas.const import (
-    CONF_ACTIVE_THRESHOLD,
-    CONF_AREA_NAME,
-    CONF_CLIMATE_ENTITY,
-    CONF_ENERGY_ENTITY,
-    CONF_HUMIDITY_ENTITY,
-    CONF_MOTION_ENTITY,
-    CONF_POWER_ENTITY,
-    CONF_TEMP_ENTITY,
-    CONF_WINDOW_ENTITY,
-    STATE_ACTIVE,
-)
+from homeassistant.core import Event
+
+from custom_components.custom_areas.const import CONF_AREA_NAME, STATE_ACTIVE
 from custom_components.custom_areas.sensor import (
     AreaSensorCoordinator,
     AreaSummarySensor,
@@ -27,60 +15,28 @@ from custom_components.custom_areas.sensor import (
     EnergySensor,
     HumiditySensor,
     PowerSensor,
-    TemperatureSensor,
 )
 
 
-@pytest.fixture
-def mock_config_entry():
-    """Mock config entry."""
-    entry = MagicMock(spec=ConfigEntry)
-    entry.entry_id = "test_entry_id"
-    entry.data = {
-        CONF_AREA_NAME: "Test Area",
-        CONF_POWER_ENTITY: "sensor.power",
-        CONF_ENERGY_ENTITY: "sensor.energy",
-        CONF_TEMP_ENTITY: "sensor.temperature",
-        CONF_HUMIDITY_ENTITY: "sensor.humidity",
-        CONF_MOTION_ENTITY: "binary_sensor.motion",
-        CONF_WINDOW_ENTITY: "binary_sensor.window",
-        CONF_CLIMATE_ENTITY: "climate.thermostat",
-        CONF_ACTIVE_THRESHOLD: 50.0,
-    }
-    return entry
-
-
-@pytest.fixture
-def mock_hass():
-    """Mock Home Assistant."""
-    hass = MagicMock(spec=HomeAssistant)
-    hass.states = MagicMock()
-    return hass
+def make_state(value, **attributes):
+    """Build a read-only stand-in for a Home Assistant State."""
+    return SimpleNamespace(state=value, attributes=attributes)
 
 
-@pytest.fixture
-def mock_coordinator(mock_hass, mock_config_entry):
-    """Mock coordinator."""
-    coordinator = AreaSensorCoordinator(mock_hass, mock_config_entry)
-    return coordinator
-
-
-def test_area_summary_sensor_initialization(mock_coordinator, mock_config_entry, mock_hass):
+def test_area_summary_sensor_initialization(summary_sensor):
     """Test area summary sensor initialization."""
-    sensor = AreaSummarySensor(mock_coordinator, mock_config_entry)
-    sensor.hass = mock_hass
+    assert summary_sensor.name == "Test Area"
+    assert summary_sensor.unique_id == "custom_area_test_entry_id_summary"
+    assert summary_sensor.should_poll is False
 
-    assert sensor.name == "Test Area"
-    assert sensor.unique_id == "custom_area_test_entry_id_summary"
-    assert sensor.should_poll is False
 
-
-def test_area_summary_sensor_state_unknown(mock_coordinator, mock_config_entry, mock_hass):
+def test_area_summary_sensor_state_unknown(mock_config_entry, mock_hass):
     """Test area summary sensor state when no entities configured."""
     # Configure entry with no entities
     mock_config_entry.data = {CONF_AREA_NAME: "Test Area"}
+    coordinator = AreaSensorCoordinator(mock_hass, mock_config_entry)
 
-    sensor = AreaSummarySensor(mock_coordinator, mock_config_entry)
+    sensor = AreaSummarySensor(coordinator, mock_config_entry)
     sensor.hass = mock_hass
 
     # Mock hass.states.get to return None
@@ -89,151 +45,46 @@ def test_area_summary_sensor_state_unknown(mock_coordinator, mock_config_entry,
     assert sensor.state == STATE_UNKNOWN
 
 
-def test_area_summary_sensor_state_idle(mock_coordinator, mock_config_entry, mock_hass):
-    """Test area summary sensor state when entities exist but no activity."""
-    sensor = AreaSummarySensor(mock_coordinator, mock_config_entry)
-    sensor.hass = mock_hass
-
-    # Mock states for entities
-    power_state = MagicMock()
-    power_state.state = "10.0"  # Below threshold
-
-    motion_state = MagicMock()
-    motion_state.state = STATE_OFF
-
-    def mock_get(entity_id):
-        if entity_id == "sensor.power":
-            return power_state
-        elif entity_id == "binary_sensor.motion":
-            return motion_state
-        return None
-
-    mock_hass.states.get = mock_get
-
-    assert sensor.state == STATE_IDLE
-
-
-def test_area_summary_sensor_state_active_motion(mock_coordinator, mock_config_entry, mock_hass):
-    """Test area summary sensor state when motion detected."""
-    sensor = AreaSummarySensor(mock_coordinator, mock_config_entry)
-    sensor.hass = mock_hass
-
-    # Mock motion state as ON
-    motion_state = MagicMock()
-    motion_state.state = STATE_ON
-
-    def mock_get(entity_id):
-        if entity_id == "binary_sensor.motion":
-            return motion_state
-        return None
-
-    mock_hass.states.get = mock_get
-
-    assert sensor.state == STATE_ACTIVE
-
-
-def test_area_summary_sensor_state_active_power(mock_coordinator, mock_config_entry, mock_hass):
-    """Test area summary sensor state when power above threshold."""
-    sensor = AreaSummarySensor(mock_coordinator, mock_config_entry)
-    sensor.hass = mock_hass
-
-    # Mock power state above threshold
-    power_state = MagicMock()
-    power_state.state = "75.0"  # Above 50.0 threshold
-
-    motion_state = MagicMock()
-    motion_state.state = STATE_OFF
-
-    def mock_get(entity_id):
-        if entity_id == "sensor.power":
-            return power_state
-        elif entity_id == "binary_sensor.motion":
-            return motion_state
-        return None
-
-    mock_hass.states.get = mock_get
+@pytest.mark.parametrize(
+    ("states", "expected"),
+    [
+        # Power below the 50.0 threshold and no motion
+        ({"sensor.power": "10.0", "binary_sensor.motion": STATE_OFF}, STATE_IDLE),
+        ({"binary_sensor.motion": STATE_ON}, STATE_ACTIVE),
+        ({"sensor.power": "75.0", "binary_sensor.motion": STATE_OFF}, STATE_ACTIVE),
+    ],
+    ids=["idle", "active_motion", "active_power"],
+)
+def test_area_summary_sensor_state(summary_sensor, mock_hass, states, expected):
+    """Test area summary sensor state from motion and power."""
+    mock_hass.states.get = {entity_id: make_state(value) for entity_id, value in states.items()}.get
 
-    assert sensor.state == STATE_ACTIVE
+    assert summary_sensor.state == expected
 
 
-def test_area_summary_sensor_attributes(mock_coordinator, mock_config_entry, mock_hass):
+def test_area_summary_sensor_attributes(summary_sensor, mock_hass):
     """Test area summary sensor attributes."""
-    sensor = AreaSummarySensor(mock_coordinator, mock_config_entry)
-    sensor.hass = mock_hass
-
-    # Create and assign measurement sensors
-    power_sensor = PowerSensor(mock_coordinator, mock_config_entry)
-    power_sensor.hass = mock_hass
-    setattr(power_sensor, "_attr_unit_of_measurement", "W")
-    sensor.power_sensor = power_sensor
-
-    energy_sensor = EnergySensor(mock_coordinator, mock_config_entry)
-    energy_sensor.hass = mock_hass
-    setattr(energy_sensor, "_attr_unit_of_measurement", "Wh")
-    sensor.energy_sensor = energy_sensor
-
-    temperature_sensor = TemperatureSensor(mock_coordinator, mock_config_entry)
-    temperature_sensor.hass = mock_hass
-    setattr(temperature_sensor, "_attr_unit_of_measurement", "°C")
-    sensor.temperature_sensor = temperature_sensor
-
-    humidity_sensor = HumiditySensor(mock_coordinator, mock_config_entry)
-    humidity_sensor.hass = mock_hass
-    setattr(humidity_sensor, "_attr_unit_of_measurement", "%")
-    sensor.humidity_sensor = humidity_sensor
-
-    climate_target_sensor = ClimateTargetSensor(mock_coordinator, mock_config_entry)
-    climate_target_sensor.hass = mock_hass
-    setattr(climate_target_sensor, "_attr_unit_of_measurement", "°C")
-    sensor.climate_target_sensor = climate_target_sensor
-
     # Mock states
-    motion_state = MagicMock()
-    motion_state.state = STATE_ON
-
-    window_state = MagicMock()
-    window_state.state = STATE_OFF
-
-    climate_state = MagicMock()
-    climate_state.state = "heat"
-    climate_state.attributes = {"temperature": 21.5, "unit_of_measurement": "°C"}
-
-    power_state = MagicMock()
-    power_state.state = "25.5"
-    power_state.attributes = {"unit_of_measurement": "W"}
-
-    energy_state = MagicMock()
-    energy_state.state = "150.0"
-    energy_state.attributes = {"unit_of_measurement": "Wh"}
-
-    temp_state = MagicMock()
-    temp_state.state = "22.3"
-    temp_state.attributes = {"unit_of_measurement": "°C"}
-
-    humidity_state = MagicMock()
-    humidity_state.state = "65.0"
-    humidity_state.attributes = {"unit_of_measurement": "%"}
-
-    def mock_get(entity_id):
-        if entity_id == "binary_sensor.motion":
-            return motion_state
-        elif entity_id == "binary_sensor.window":
-            return window_state
-        elif entity_id == "climate.thermostat":
-            return climate_state
-        elif entity_id == "sensor.power":
-            return power_state
-        elif entity_id == "sensor.energy":
-            return energy_state
-        elif entity_id == "sensor.temperature":
-            return temp_state
-        elif entity_id == "sensor.humidity":
-            return humidity_state
-        return None
-
-    mock_hass.states.get = mock_get
-
-    attrs = sensor.extra_state_attributes
+    motion_state = make_state(STATE_ON)
+    window_state = make_state(STATE_OFF)
+    climate_state = make_state("heat", temperature=21.5, unit_of_measurement="°C")
+    power_state = make_state("25.5", unit_of_measurement="W")
+    energy_state = make_state("150.0", unit_of_measurement="Wh")
+    temp_state = make_state("22.3", unit_of_measurement="°C")
+    humidity_state = make_state("65.0", unit_of_measurement="%")
+
+    states = {
+        "binary_sensor.motion": motion_state,
+        "binary_sensor.window": window_state,
+        "climate.thermostat": climate_state,
+        "sensor.power": power_state,
+        "sensor.energy": energy_state,
+        "sensor.temperature": temp_state,
+        "sensor.humidity": humidity_state,
+    }
+    mock_hass.states.get = states.get
+
+    attrs = summary_sensor.extra_state_attributes
 
     # Binary sensor attributes
     assert attrs["occupied"] is True
@@ -248,127 +99,63 @@ def test_area_summary_sensor_attributes(mock_coordinator, mock_config_entry, moc
     assert attrs["climate_target"] == "21.5 °C"
 
 
-def test_area_summary_sensor_icon(mock_coordinator, mock_config_entry, mock_hass):
-    """Test area summary sensor icon selection."""
-    sensor = AreaSummarySensor(mock_coordinator, mock_config_entry)
-    sensor.hass = mock_hass
-
-    # Test default icon
-    motion_state = MagicMock()
-    motion_state.state = STATE_OFF
-
-    window_state = MagicMock()
-    window_state.state = STATE_OFF
+def test_area_summary_sensor_attributes_cached(summary_sensor, mock_hass):
+    """Test attributes are reused until a tracked state object is replaced."""
+    motion_state = make_state(STATE_OFF)
+    states = {"binary_sensor.motion": motion_state}
+    mock_hass.states.get = states.get
 
-    def mock_get(entity_id):
-        if entity_id == "binary_sensor.motion":
-            return motion_state
-        elif entity_id == "binary_sensor.window":
-            return window_state
-        return None
+    attrs = summary_sensor.extra_state_attributes
+    assert attrs["occupied"] is False
+    assert summary_sensor.extra_state_attributes is attrs
 
-    mock_hass.states.get = mock_get
+    # HA replaces the State object on every change
+    new_motion_state = make_state(STATE_ON)
+    states["binary_sensor.motion"] = new_motion_state
 
-    assert sensor.icon == "mdi:texture-box"
-
-    # Test motion icon
-    motion_state.state = STATE_ON
-    assert sensor.icon == "mdi:motion-sensor"
-
-    # Test window icon (takes precedence over motion)
-    window_state.state = STATE_ON
-    assert sensor.icon == "mdi:window-open-variant"
-
-
-def test_unit_constant_fallbacks(monkeypatch):
-    """Test unit constant import fallbacks work correctly."""
-    from custom_components.custom_areas import sensor
+    assert summary_sensor.extra_state_attributes["occupied"] is True
 
-    # Mock sys.modules to simulate missing modules
-    original_modules = dict(sys.modules)
 
-    # Remove the modules we want to test as missing
-    modules_to_remove = [
-        "homeassistant.util.unit_system",
-        "homeassistant.util.unit_conversion",
-        "homeassistant.const",
-    ]
-
-    for module in modules_to_remove:
-        sys.modules.pop(module, None)
-
-    try:
-        # Reload the module to test the import logic
-        import importlib
-
-        importlib.reload(sensor)
-
-        # Verify constants are set to expected fallback values
-        assert sensor.UNIT_CELSIUS == "°C"
-        assert sensor.UNIT_WATT == "W"
-        assert sensor.UNIT_WATT_HOUR == "Wh"
+@pytest.mark.parametrize(
+    ("motion", "window", "expected"),
+    [
+        (STATE_OFF, STATE_OFF, "mdi:texture-box"),
+        (STATE_ON, STATE_OFF, "mdi:motion-sensor"),
+        # Window takes precedence over motion
+        (STATE_ON, STATE_ON, "mdi:window-open-variant"),
+    ],
+    ids=["default", "motion", "window"],
+)
+def test_area_summary_sensor_icon(summary_sensor, mock_hass, motion, window, expected):
+    """Test area summary sensor icon selection."""
+    states = {
+        "binary_sensor.motion": make_state(motion),
+        "binary_sensor.window": make_state(window),
+    }
+    mock_hass.states.get = states.get
 
-    finally:
-        # Restore original modules
-        sys.modules.update(original_modules)
+    assert summary_sensor.icon == expected
 
 
-def test_unit_constants_with_deprecated_fallback(monkeypatch):
-    """Test that deprecated constants are used when new ones fail."""
+def test_unit_constants():
+    """Test default units come from Home Assistant's unit enums."""
     from custom_components.custom_areas import sensor
 
-    # Mock only the new unit system modules as missing
-    original_modules = dict(sys.modules)
-
-    modules_to_remove = [
-        "homeassistant.util.unit_system",
-        "homeassistant.util.unit_conversion",
-    ]
-
-    for module in modules_to_remove:
-        sys.modules.pop(module, None)
-
-    try:
-        # Reload to test fallback to deprecated constants
-        import importlib
+    assert sensor.UNIT_CELSIUS == "°C"
+    assert sensor.UNIT_HUMIDITY == "%"
+    assert sensor.UNIT_WATT == "W"
+    assert sensor.UNIT_WATT_HOUR == "Wh"
 
-        importlib.reload(sensor)
 
-        # Should use deprecated constants (which will show deprecation
-        # warnings but work)
-        assert sensor.UNIT_CELSIUS is not None
-        assert sensor.UNIT_WATT is not None
-        assert sensor.UNIT_WATT_HOUR is not None
-
-        # The deprecated constants have the same string values as our fallbacks
-        # This is expected and correct behavior
-        assert sensor.UNIT_CELSIUS == "°C"
-        assert sensor.UNIT_WATT == "W"
-        assert sensor.UNIT_WATT_HOUR == "Wh"
-
-    finally:
-        # Restore original modules
-        sys.modules.update(original_modules)
-
-
-def test_sensor_functionality_with_fallback_units(mock_coordinator, mock_config_entry, mock_hass):
+def test_sensor_functionality_with_fallback_units(summary_sensor, mock_hass):
     """Test that summary sensor works correctly with simplified attributes."""
-    sensor_instance = AreaSummarySensor(mock_coordinator, mock_config_entry)
-    sensor_instance.hass = mock_hass
-
     # Mock states - only binary sensors for summary sensor
-    motion_state = MagicMock()
-    motion_state.state = STATE_ON
-
-    def mock_get(entity_id):
-        if entity_id == "binary_sensor.motion":
-            return motion_state
-        return None
+    motion_state = make_state(STATE_ON)
 
-    mock_hass.states.get = mock_get
+    mock_hass.states.get = {"binary_sensor.motion": motion_state}.get
 
     # Test that only appropriate attributes are generated for summary sensor
-    attrs = sensor_instance.extra_state_attributes
+    attrs = summary_sensor.extra_state_attributes
 
     # Only binary sensor attributes should be present
     assert attrs["occupied"] is True
@@ -382,3 +169,68 @@ def test_sensor_functionality_with_fallback_units(mock_coordinator, mock_config_
     assert "power" not in attrs
     assert "energy" not in attrs
     assert "temperature" not in attrs
+
+
+def test_coordinator_coalesces_state_changes(mock_coordinator, mock_hass):
+    """Test state changes in one loop iteration produce one write per sensor."""
+    mock_hass.loop = MagicMock()
+    sensor = MagicMock()
+    mock_coordinator.register_sensor(sensor)
+
+    mock_coordinator._handle_state_change(Event("state_changed", {"entity_id": "sensor.power"}))
+    mock_coordinator._handle_state_change(Event("state_changed", {"entity_id": "sensor.energy"}))
+
+    mock_hass.loop.call_soon.assert_called_once_with(mock_coordinator._flush_updates)
+    sensor.async_write_ha_state.assert_not_called()
+
+    mock_coordinator._flush_updates()
+
+    sensor.async_write_ha_state.assert_called_once()
+
+
+def test_measurement_sensors_refresh_from_source(mock_coordinator, mock_config_entry, mock_hass):
+    """Test measurement sensors take their value and unit from the source state."""
+    power_state = make_state("25.5", unit_of_measurement="kW")
+    climate_state = make_state("heat", temperature=21.5)
+    humidity_state = make_state(STATE_UNKNOWN)
+
+    states = {
+        "sensor.power": power_state,
+        "climate.thermostat": climate_state,
+        "sensor.humidity": humidity_state,
+    }
+    mock_hass.states.get = states.get
+
+    power_sensor = PowerSensor(mock_coordinator, mock_config_entry)
+    climate_target_sensor = ClimateTargetSensor(mock_coordinator, mock_config_entry)
+    humidity_sensor = HumiditySensor(mock_coordinator, mock_config_entry)
+    energy_sensor = EnergySensor(mock_coordinator, mock_config_entry)
+    for sensor in (power_sensor, climate_target_sensor, humidity_sensor, energy_sensor):
+        sensor.async_refresh_from_source()
+
+    assert power_sensor.native_value == 25.5
+    assert power_sensor.native_unit_of_measurement == "kW"
+    assert climate_target_sensor.native_value == 21.5
+    assert climate_target_sensor.native_unit_of_measurement == "°C"
+    assert humidity_sensor.native_value is None
+    assert humidity_sensor.native_unit_of_measurement == "%"
+    assert energy_sensor.native_value is None
+    assert energy_sensor.native_unit_of_measurement == "Wh"
+
+
+def test_coordinator_updates_only_dependent_sensors(mock_coordinator, mock_hass):
+    """Test a source change only writes the sensors that depend on it."""
+    mock_hass.loop = MagicMock()
+    power_sensor = MagicMock()
+    temperature_sensor = MagicMock()
+    summary_sensor = MagicMock()
+    mock_coordinator.register_sensor(power_sensor, ["sensor.power"])
+    mock_coordinator.register_sensor(temperature_sensor, ["sensor.temperature"])
+    mock_coordinator.register_sensor(summary_sensor)
+
+    mock_coordinator._handle_state_change(Event("state_changed", {"entity_id": "sensor.power"}))
+    mock_coordinator._flush_updates()
+
+    power_sensor.async_write_ha_state.assert_called_once()
+    summary_sensor.async_write_ha_state.assert_called_once()
+    temperature_sensor.async_write_ha_state.assert_not_called()